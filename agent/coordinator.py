@@ -11,24 +11,69 @@ Responsibilities:
 - Take action or return explanations
 """
 
+from __future__ import annotations
+
+import copy
 import os
-from typing import Dict, List, Optional, Tuple
-from dotenv import load_dotenv
-import pandas as pd
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+# pandas and the Sheets client are heavy; they are imported inside the
+# functions that touch sheet data so parse-only/invalid requests skip them
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Import agent modules
-from agent.planner import plan, validate_intent
-from agent.rules import validate_assignment, check_mission_feasibility
+from agent.planner import plan_cached, validate_intent
+from agent.rules import validate_assignment, check_mission_feasibility, missing_csv_items
 from agent.memory import agent_state
-
-# Import tools
-from tools.sheets import get_sheet_as_df, update_sheet_from_df
-from tools.pilots import add_new_pilot
-from tools.drones import add_new_drone
-from tools.missions import add_new_mission
 from intent_parser import parse_intent, parse_intent_with_llm
 
-load_dotenv()
+# Sheet locations are fixed for the life of the process (config also loads
+# .env, which the getenv tuning knobs below rely on)
+from config import (
+    DRONES_SHEET_RANGE,
+    MISSIONS_SHEET_RANGE,
+    PILOTS_SHEET_RANGE,
+    SPREADSHEET_ID,
+)
+
+# Frames prepared for the agent (typed columns + lookup index) keyed by
+# (spreadsheet_id, range). Raw reads are cached with a TTL in tools.sheets;
+# each entry here records the snapshot version it was derived from and is
+# reused only while tools.sheets still holds that same snapshot.
+_PREPARED_SHEETS: Dict[Tuple[str, str], Tuple[float, pd.DataFrame, Dict[str, Dict[str, int]]]] = {}
+
+# Fetch several sheets with one values.batchGet call. Set SHEETS_BATCH_GET=0
+# for backends without batchGet; the sheets are then read concurrently.
+USE_BATCH_GET = os.getenv('SHEETS_BATCH_GET', '1') != '0'
+
+# Minimum RapidFuzz ratio (0-100) for a fuzzy pilot-name match to be accepted.
+# Fuzzy matches feed assignment writes, so they are also limited to names
+# within FUZZY_MAX_LENGTH_DIFF characters of the typed one (no prefix or
+# partial matches) and to a single candidate above the threshold.
+FUZZY_MATCH_THRESHOLD = float(os.getenv('FUZZY_MATCH_THRESHOLD', '85'))
+FUZZY_MAX_LENGTH_DIFF = 1
+FUZZY_MIN_LENGTH = 4
+
+# Columns indexed for O(1) entity resolution, mapped to the str method
+# ('lower'/'upper') applied to both the stored keys and the lookup value.
+_PILOT_KEYS = {'name': 'lower', 'pilot_id': 'upper'}
+_DRONE_KEYS = {'drone_id': 'upper'}
+_MISSION_KEYS = {'project_id': 'upper'}
+_COLUMN_POSITIONS = '_columns'
+
+# Columns compared or rewritten by the agent; stored as Arrow-backed strings
+# when pyarrow is installed so .str and equality run in Arrow's kernels
+_STRING_COLUMNS = ('pilot_id', 'name', 'drone_id', 'project_id', 'current_assignment')
+
+# Low-cardinality columns stored as pandas categoricals: equality and
+# value_counts run over small integer codes instead of strings. Categories
+# are inferred from the sheet (no fixed list), and new values are added as
+# they are written (see _set_assignment).
+_CATEGORY_COLUMNS = ('status',)
+_STATUS_COUNTS = '_status_counts'
 
 
 def run_agent(user_query: str, use_llm: bool = False) -> Dict:
@@ -45,13 +90,15 @@ def run_agent(user_query: str, use_llm: bool = False) -> Dict:
             - message: Human-readable response
             - data: Any relevant data to display
             - steps_taken: List of steps executed
+            - action: The parsed intent's action (e.g. 'assign', 'query_info')
     """
     
     # Step 1: Parse user intent
     if use_llm:
         intent = parse_intent_with_llm(user_query)
     else:
-        intent = parse_intent(user_query)
+        # Callers may mutate the intent, so hand out a copy of the cached parse
+        intent = copy.deepcopy(_parse_intent_cached(user_query))
     
     # Validate intent structure
     is_valid, error_msg = validate_intent(intent)
@@ -60,25 +107,32 @@ def run_agent(user_query: str, use_llm: bool = False) -> Dict:
             'success': False,
             'message': f"Could not understand request: {error_msg}",
             'data': None,
-            'steps_taken': []
+            'steps_taken': [],
+            'action': intent.get('action')
         }
     
-    # Step 2: Create execution plan
-    execution_plan = plan(intent)
+    # Step 2: Create execution plan (memoised per intent shape; read-only)
+    execution_plan = plan_cached(intent)
     
     # Step 3: Execute the plan
     result = _execute_plan(execution_plan, intent)
+    # Returned with the result: agent_state is shared by every session
+    result['action'] = intent['action']
     
-    # Step 4: Update agent memory
-    agent_state['last_decision'] = {
-        'query': user_query,
-        'intent': intent,
-        'result': result
-    }
+    # Step 4: Update agent memory (a compact record, without sheet data)
+    agent_state.record_decision(user_query, intent, result)
     
     return result
 
 
+@lru_cache(maxsize=512)
+def _parse_intent_cached(user_query: str) -> Dict:
+    """
+    Memoised rule-based parse; the parser is deterministic for a given query.
+    """
+    return parse_intent(user_query)
+
+
 def _execute_plan(execution_plan: List[Dict], intent: Dict) -> Dict:
     """
     Execute the planned steps.
@@ -88,183 +142,522 @@ def _execute_plan(execution_plan: List[Dict], intent: Dict) -> Dict:
         'pilots_df': None,
         'drones_df': None,
         'missions_df': None,
+        'indexes': {},
         'resolved_entities': {}
     }
     
+    handlers = _compile_plan(tuple(step['tool'] for step in execution_plan))
+    
+    for step, handler in zip(execution_plan, handlers):
+        steps_taken.append(step['description'])
+        
+        # Execute the tool; a handler returns a result dict to finish the plan
+        if handler is None:
+            continue
+        
+        result = handler(context, step['params'], intent, steps_taken)
+        if result is not None:
+            return result
+    
+    # If we got here without returning, something went wrong
+    return {
+        'success': False,
+        'message': "Execution completed but no result was generated",
+        'data': None,
+        'steps_taken': steps_taken
+    }
+
+
+def _sheets_error(error: Exception, steps_taken: List[str]) -> Dict:
+    """
+    Build the failure result for a Google Sheets read/write error.
+    
+    Only Sheets I/O is guarded (see tools.sheets.SHEETS_ERRORS); other
+    exceptions are bugs and propagate with their traceback.
+    """
+    return {
+        'success': False,
+        'message': f"Google Sheets error: {error}",
+        'data': None,
+        'steps_taken': steps_taken
+    }
+
+
+def _to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the agent's key/status columns to 'string[pyarrow]' in place.
+    
+    Missing cells are filled with '' first: NA cannot be serialised back to
+    the Sheets API and the rules engine expects plain strings. Without
+    pyarrow the frame is returned unchanged.
+    """
     try:
-        for step in execution_plan:
-            tool = step['tool']
-            params = step['params']
-            description = step['description']
-            
-            steps_taken.append(description)
-            
-            # Execute the tool
-            if tool == 'load_pilots':
-                context['pilots_df'] = _load_pilots()
-            
-            elif tool == 'load_drones':
-                context['drones_df'] = _load_drones()
-            
-            elif tool == 'load_missions':
-                context['missions_df'] = _load_missions()
-            
-            elif tool == 'resolve_entities':
-                context['resolved_entities'] = _resolve_entities(params, context)
-            
-            elif tool == 'validate_assignment':
-                validation_result = _validate_assignment_step(context)
-                if not validation_result['success']:
-                    return validation_result
-            
-            elif tool == 'execute_assignment':
-                return _execute_assignment(context, steps_taken)
-            
-            elif tool == 'validate_reassignment':
-                validation_result = _validate_reassignment_step(context, params)
-                if not validation_result['success']:
-                    return validation_result
-            
-            elif tool == 'execute_reassignment':
-                return _execute_reassignment(context, steps_taken)
-            
-            elif tool == 'set_urgent_mode':
-                agent_state['urgent_mode'] = params.get('urgent', False)
-            
-            elif tool == 'parse_pilot_info':
-                context['new_pilot_data'] = _parse_pilot_info(intent)
-            
-            elif tool == 'add_pilot':
-                return _add_pilot_handler(context, steps_taken, intent)
-            
-            elif tool == 'parse_drone_info':
-                context['new_drone_data'] = _parse_drone_info(intent)
-            
-            elif tool == 'add_drone':
-                return _add_drone_handler(context, steps_taken, intent)
-            
-            elif tool == 'parse_mission_info':
-                context['new_mission_data'] = _parse_mission_info(intent)
-            
-            elif tool == 'add_mission':
-                return _add_mission_handler(context, steps_taken, intent)
-            
-            elif tool == 'format_query_response':
-                return _format_query_response(context, params, steps_taken)
-            
-            elif tool == 'format_confirmation':
-                return _format_confirmation(context, params, steps_taken)
-            
-            elif tool == 'unknown_intent':
-                return {
-                    'success': False,
-                    'message': step['description'],
-                    'data': None,
-                    'steps_taken': steps_taken
-                }
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return df
+    
+    for column in _STRING_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].fillna('').astype('string[pyarrow]')
+    return df
+
+
+def _to_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the agent's low-cardinality columns to 'category' in place.
+    
+    Frames written back by the agent are cached already converted, so
+    categorical columns are left as they are.
+    """
+    for column in _CATEGORY_COLUMNS:
+        if column in df.columns and df[column].dtype != 'category':
+            df[column] = df[column].fillna('').astype('category')
+    return df
+
+
+def _build_index(df: pd.DataFrame, key_columns: Dict[str, str]) -> Dict[str, Dict[str, int]]:
+    """
+    Build {column: {normalised value: row position}} lookup tables.
+    
+    The first occurrence of a value wins, matching the previous
+    "first matching row" behaviour of the boolean-mask scans. Column
+    positions are stored under _COLUMN_POSITIONS for positional writes and
+    per-status row counts under _STATUS_COUNTS for summary replies.
+    """
+    index = {_COLUMN_POSITIONS: {column: i for i, column in enumerate(df.columns)}}
+    if 'status' in df.columns:
+        index[_STATUS_COUNTS] = df['status'].value_counts().to_dict()
+    for column, case in key_columns.items():
+        lookup = {}
+        if column in df.columns:
+            # Normalise the whole column once with vectorised string ops
+            keys = getattr(df[column].astype(str).str, case)()
+            for position, value in enumerate(keys.tolist()):
+                lookup.setdefault(value, position)
+        index[column] = lookup
+    return index
+
+
+def _prepared_snapshot(range_name: str) -> Optional[Tuple[pd.DataFrame, Dict[str, Dict[str, int]]]]:
+    """
+    Return (copy of prepared frame, index) if built from the current snapshot.
+    """
+    entry = _PREPARED_SHEETS.get((SPREADSHEET_ID, range_name))
+    if entry is None:
+        return None
+    
+    from tools.sheets import get_cached_version
+    
+    if get_cached_version(SPREADSHEET_ID, range_name) != entry[0]:
+        return None
+    return entry[1].copy(), entry[2]
+
+
+def _prepare_sheet(range_name: str, df: pd.DataFrame, key_columns: Dict[str, str]) -> Tuple[pd.DataFrame, Dict[str, Dict[str, int]]]:
+    """
+    Type and index a frame read from tools.sheets; remember it for reuse.
+    
+    Returns:
+        Tuple of (copy of the prepared frame, lookup index for key columns)
+    """
+    from tools.sheets import get_cached_version
+    
+    df = _to_categories(_to_arrow_strings(df))
+    index = _build_index(df, key_columns)
+    
+    version = get_cached_version(SPREADSHEET_ID, range_name)
+    if version is not None:
+        _PREPARED_SHEETS[(SPREADSHEET_ID, range_name)] = (version, df, index)
+    return df.copy(), index
+
+
+def _load_sheet(range_name: str, key_columns: Dict[str, str]) -> Tuple[pd.DataFrame, Dict[str, Dict[str, int]]]:
+    """
+    Load a sheet range, reusing the prepared frame while its snapshot is fresh.
+    
+    Args:
+        range_name: A1 range of the sheet to load
+        key_columns: Columns to index, mapped to their str case method
+    
+    Returns:
+        Tuple of (DataFrame safe to modify, lookup index for key columns)
+    """
+    prepared = _prepared_snapshot(range_name)
+    if prepared is not None:
+        return prepared
+    
+    from tools.sheets import get_sheet_as_df
+    
+    return _prepare_sheet(range_name, get_sheet_as_df(SPREADSHEET_ID, range_name), key_columns)
+
+
+def _load_sheets(sheets: List[str]) -> Dict[str, Tuple[pd.DataFrame, Dict[str, Dict[str, int]]]]:
+    """
+    Load several sheets, fetching every cache miss in one batchGet call
+    (or concurrently, one read per sheet, when USE_BATCH_GET is off).
+    
+    Args:
+        sheets: Sheet names ('pilots', 'drones', 'missions')
+    
+    Returns:
+        Dictionary mapping sheet name to (DataFrame, index)
+    """
+    loaded = {}
+    missing = []
+    for sheet in sheets:
+        prepared = _prepared_snapshot(_SHEETS[sheet][0])
+        if prepared is not None:
+            loaded[sheet] = prepared
+        else:
+            missing.append(sheet)
+    
+    if len(missing) > 1 and not USE_BATCH_GET:
+        # One read per sheet, overlapped on worker threads so the wall time
+        # is the slowest read rather than the sum (tools.sheets keeps one
+        # service per thread, so the threads do not share a connection)
+        from concurrent.futures import ThreadPoolExecutor
         
-        # If we got here without returning, something went wrong
-        return {
-            'success': False,
-            'message': "Execution completed but no result was generated",
-            'data': None,
-            'steps_taken': steps_taken
-        }
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            futures = {sheet: executor.submit(_load_sheet, *_SHEETS[sheet]) for sheet in missing}
+        for sheet, future in futures.items():
+            loaded[sheet] = future.result()
+    elif missing:
+        from tools.sheets import batch_get_sheets_as_df
         
-    except Exception as e:
-        return {
-            'success': False,
-            'message': f"Error during execution: {str(e)}",
-            'data': None,
-            'steps_taken': steps_taken
-        }
+        frames = batch_get_sheets_as_df(SPREADSHEET_ID, [_SHEETS[sheet][0] for sheet in missing])
+        for sheet in missing:
+            range_name, key_columns = _SHEETS[sheet]
+            loaded[sheet] = _prepare_sheet(range_name, frames[range_name], key_columns)
+    
+    return loaded
+
+
+def _store_sheet(range_name: str, df: pd.DataFrame, key_columns: Dict[str, str]) -> None:
+    """
+    Record a frame we just wrote as the prepared snapshot for its range.
+    
+    tools.sheets caches full-table writes, so the frame is reused on the
+    next load without another read or re-index.
+    """
+    from tools.sheets import get_cached_version
+    
+    version = get_cached_version(SPREADSHEET_ID, range_name)
+    if version is not None:
+        _PREPARED_SHEETS[(SPREADSHEET_ID, range_name)] = (version, df.copy(), _build_index(df, key_columns))
 
 
-def _load_pilots() -> pd.DataFrame:
+def _load_pilots() -> Tuple[pd.DataFrame, Dict[str, Dict[str, int]]]:
     """Load pilots from Google Sheets."""
-    spreadsheet_id = os.getenv('SPREADSHEET_ID')
-    pilots_range = os.getenv('PILOTS_SHEET_RANGE')
-    return get_sheet_as_df(spreadsheet_id, pilots_range)
+    return _load_sheet(PILOTS_SHEET_RANGE, _PILOT_KEYS)
 
 
-def _load_drones() -> pd.DataFrame:
+def _load_drones() -> Tuple[pd.DataFrame, Dict[str, Dict[str, int]]]:
     """Load drones from Google Sheets."""
-    spreadsheet_id = os.getenv('SPREADSHEET_ID')
-    drones_range = os.getenv('DRONES_SHEET_RANGE')
-    return get_sheet_as_df(spreadsheet_id, drones_range)
+    return _load_sheet(DRONES_SHEET_RANGE, _DRONE_KEYS)
 
 
-def _load_missions() -> pd.DataFrame:
+def _load_missions() -> Tuple[pd.DataFrame, Dict[str, Dict[str, int]]]:
     """Load missions from Google Sheets."""
-    spreadsheet_id = os.getenv('SPREADSHEET_ID')
-    missions_range = os.getenv('MISSIONS_SHEET_RANGE')
-    return get_sheet_as_df(spreadsheet_id, missions_range)
+    return _load_sheet(MISSIONS_SHEET_RANGE, _MISSION_KEYS)
+
+
+# Sheet name -> (A1 range, indexed key columns)
+_SHEETS = {
+    'pilots': (PILOTS_SHEET_RANGE, _PILOT_KEYS),
+    'drones': (DRONES_SHEET_RANGE, _DRONE_KEYS),
+    'missions': (MISSIONS_SHEET_RANGE, _MISSION_KEYS),
+}
+
+# Plan tool name -> (context key prefix, loader)
+_LOADERS = {
+    'load_pilots': ('pilots', _load_pilots),
+    'load_drones': ('drones', _load_drones),
+    'load_missions': ('missions', _load_missions),
+}
+
+
+# Per sheet: key column (always filled, so it gives the row total) and the
+# column tallied for summaries, both located by header name
+SUMMARY_FIELDS: Dict[str, Tuple[str, Optional[str]]] = {
+    'pilots': ('pilot_id', 'status'),
+    'drones': ('drone_id', 'status'),
+    'missions': ('project_id', None),
+}
+
+# (spreadsheet_id, range) -> header row, so the summary columns of a range
+# are located without re-reading its header; dropped when a header moves
+_SUMMARY_HEADERS: Dict[Tuple[str, str], List[str]] = {}
+
+
+def read_summary_counts(
+    spreadsheet_id: str,
+    ranges: Dict[str, Optional[str]]
+) -> Dict[str, Optional[Tuple[int, Dict[str, int]]]]:
+    """
+    Row totals and status tallies from two narrow columns per sheet.
+    
+    The key and status columns (see SUMMARY_FIELDS) are located in the
+    header row of each range, read once per range and remembered, then
+    fetched together in one column-major batchGet. Totals count the key
+    column, which is always filled, so rows with blank trailing cells in
+    other columns are still counted. A sheet whose header lacks a column,
+    or whose columns have moved since the header was read, maps to None
+    and the caller falls back to loading the whole sheet.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        ranges: Sheet name ('pilots', 'drones', 'missions') -> table range
+    
+    Returns:
+        Dictionary mapping sheet name to (row count, {status: count}), or None
+    """
+    from tools.sheets import a1_column, a1_header_row, batch_get_columns, batch_get_sheet_data
+    
+    unread = [
+        range_name for range_name in ranges.values()
+        if range_name and (spreadsheet_id, range_name) not in _SUMMARY_HEADERS
+    ]
+    if unread:
+        header_rows = batch_get_sheet_data(spreadsheet_id, [a1_header_row(range_name) for range_name in unread])
+        for range_name, rows in zip(unread, header_rows):
+            _SUMMARY_HEADERS[(spreadsheet_id, range_name)] = [str(cell).strip() for cell in (rows or [[]])[0]]
+    
+    # sheet -> [(column range, expected header)] for the key and status columns
+    wanted = {}
+    for sheet, range_name in ranges.items():
+        header = _SUMMARY_HEADERS.get((spreadsheet_id, range_name), []) if range_name else []
+        fields = [field for field in SUMMARY_FIELDS[sheet] if field]
+        if all(field in header for field in fields):
+            wanted[sheet] = [(a1_column(range_name, header.index(field)), field) for field in fields]
+    
+    column_ranges = [column_range for columns in wanted.values() for column_range, _ in columns]
+    fetched = batch_get_columns(spreadsheet_id, column_ranges) if column_ranges else {}
+    
+    counts = {}
+    for sheet, range_name in ranges.items():
+        counts[sheet] = None
+        if sheet not in wanted:
+            continue
+        
+        columns = [(fetched.get(column_range) or [[]])[0] for column_range, _ in wanted[sheet]]
+        if any(column[:1] != [field] for column, (_, field) in zip(columns, wanted[sheet])):
+            # The sheet was reordered: read its header again next time
+            _SUMMARY_HEADERS.pop((spreadsheet_id, range_name), None)
+            continue
+        
+        tally = {}
+        for value in (columns[1][1:] if len(columns) > 1 else []):
+            tally[value] = tally.get(value, 0) + 1
+        counts[sheet] = (len(columns[0]) - 1, tally)
+    return counts
+
+
+def _load_summary_counts(sheets: List[str]) -> Dict[str, Tuple[int, Dict[str, int]]]:
+    """
+    Row totals and status tallies for summary replies.
+    
+    Sheets with a fresh prepared snapshot are counted from its index;
+    the rest are counted from their key and status columns (see
+    read_summary_counts). Sheets those columns cannot be found in fall
+    back to a full load.
+    
+    Args:
+        sheets: Sheet names ('pilots', 'drones', 'missions')
+    
+    Returns:
+        Dictionary mapping sheet name to (row count, {status: count})
+    """
+    counts = {}
+    missing = []
+    for sheet in sheets:
+        prepared = _prepared_snapshot(_SHEETS[sheet][0])
+        if prepared is not None:
+            df, index = prepared
+            counts[sheet] = (len(df), index.get(_STATUS_COUNTS, {}))
+        elif _SHEETS[sheet][0]:
+            missing.append(sheet)
+    
+    full = [sheet for sheet in sheets if sheet not in counts and sheet not in missing]
+    if missing:
+        summary = read_summary_counts(SPREADSHEET_ID, {sheet: _SHEETS[sheet][0] for sheet in missing})
+        for sheet, sheet_counts in summary.items():
+            if sheet_counts is None:
+                full.append(sheet)
+            else:
+                counts[sheet] = sheet_counts
+    
+    if full:
+        for sheet, (df, index) in _load_sheets(full).items():
+            counts[sheet] = (len(df), index.get(_STATUS_COUNTS, {}))
+    
+    return counts
+
+
+def _find_row(context: Dict, sheet: str, column: str, value: str, case: str, fallback: Optional[str] = None) -> Optional[int]:
+    """
+    Resolve a value to a row position through the precomputed index.
+    
+    Args:
+        context: Execution context holding the sheet indexes
+        sheet: Sheet name ('pilots', 'drones', 'missions')
+        column: Indexed column to search
+        value: Value supplied by the user
+        case: str method used to normalise the value ('lower'/'upper')
+        fallback: On an exact miss, 'fuzzy' takes the closest indexed key
+            (names) and 'id' matches IDs that differ only in zero padding
+            or separators (e.g. 'D1', 'd-001' -> 'D001')
+    
+    Returns:
+        Integer row position in the sheet's DataFrame, or None if not found
+    """
+    lookup = context['indexes'].get(sheet, {}).get(column, {})
+    key = getattr(value, case)()
+    
+    position = lookup.get(key)
+    if position is None and lookup:
+        if fallback == 'fuzzy':
+            position = _fuzzy_find(lookup, key)
+        elif fallback == 'id':
+            position = _id_find(lookup, key)
+    return position
+
+
+# Resource/project IDs: letter prefix, optional separator, number
+_ID_PATTERN = re.compile(r'([A-Z]+)[\s_-]*0*(\d+)')
+
+
+def _id_find(lookup: Dict[str, int], key: str) -> Optional[int]:
+    """
+    Match an ID by prefix and numeric value, ignoring padding/separators.
+    
+    Unlike names, IDs are not scored for similarity: 'D002' is one edit
+    from 'D001' but a different drone, so only equivalent spellings match.
+    """
+    wanted = _ID_PATTERN.fullmatch(key)
+    if wanted is None:
+        return None
+    
+    for candidate, position in lookup.items():
+        match = _ID_PATTERN.fullmatch(candidate)
+        if match and match.group(1) == wanted.group(1) and int(match.group(2)) == int(wanted.group(2)):
+            return position
+    return None
+
+
+def _fuzzy_find(lookup: Dict[str, int], key: str) -> Optional[int]:
+    """
+    Closest-match fallback for typos (e.g. 'Arjn' -> 'arjun').
+    
+    Uses RapidFuzz if installed; without it only exact matches resolve.
+    Plain edit-distance ratio is used (WRatio also rewards partial and
+    token matches, so 'raj' would resolve to 'rajesh'); short keys,
+    candidates of a different length and ambiguous matches do not resolve.
+    """
+    if len(key) < FUZZY_MIN_LENGTH:
+        return None
+    
+    try:
+        from rapidfuzz import fuzz, process
+    except ImportError:
+        return None
+    
+    candidates = [name for name in lookup if abs(len(name) - len(key)) <= FUZZY_MAX_LENGTH_DIFF]
+    matches = process.extract(
+        key,
+        candidates,
+        scorer=fuzz.ratio,
+        score_cutoff=FUZZY_MATCH_THRESHOLD,
+        limit=2
+    )
+    if len(matches) != 1:
+        return None
+    return lookup[matches[0][0]]
+
+
+def _ensure_category(df: pd.DataFrame, column: str, value: str) -> None:
+    """Add value to a categorical column's categories so it can be assigned."""
+    if df[column].dtype == 'category' and value not in df[column].cat.categories:
+        df[column] = df[column].cat.add_categories([value])
+
+
+def _assignment_cells(row: int) -> List[Tuple[int, str]]:
+    """Cells written by _set_assignment for a row, as (row, column) pairs."""
+    return [(row, 'status'), (row, 'current_assignment')]
+
+
+def _set_assignment(df: pd.DataFrame, index: Dict, row: int, project_id: str) -> None:
+    """
+    Mark a resource as assigned to a project with positional scalar writes.
+    
+    Args:
+        df: Pilots or drones DataFrame to update in place
+        index: Lookup index built for df by _build_index
+        row: Row position of the resource, as resolved by _resolve_entities
+        project_id: Project the resource is now assigned to
+    """
+    columns = index[_COLUMN_POSITIONS]
+    _ensure_category(df, 'status', 'Assigned')
+    
+    # .iat is pandas' scalar fast path. Writing into Series.values instead is
+    # not safe: under copy-on-write that array is a read-only view.
+    df.iat[row, columns['status']] = 'Assigned'
+    df.iat[row, columns['current_assignment']] = project_id
 
 
 def _resolve_entities(params: Dict, context: Dict) -> Dict:
     """
     Resolve entity names/IDs to actual records.
+    
+    Row positions are kept in context['resolved_rows'] so executors can
+    update the DataFrames without searching for the rows again. Each
+    distinct row is converted to a dict once, for the rules engine and
+    the response payload.
     """
+    # (role, sheet, param, indexed column, case, fallback on an exact miss)
+    lookups = [
+        ('pilot', 'pilots', 'pilot_name', 'name', 'lower', 'fuzzy'),
+        ('drone', 'drones', 'drone_id', 'drone_id', 'upper', 'id'),
+        ('mission', 'missions', 'mission_id', 'project_id', 'upper', 'id'),
+        ('from_mission', 'missions', 'from_mission_id', 'project_id', 'upper', 'id'),
+        ('to_mission', 'missions', 'to_mission_id', 'project_id', 'upper', 'id'),
+    ]
+    
     resolved = {}
+    rows = {}
+    records = {}
     
-    # Resolve pilot
-    pilot_name = params.get('pilot_name')
-    if pilot_name and context['pilots_df'] is not None:
-        pilot_match = context['pilots_df'][
-            context['pilots_df']['name'].str.lower() == pilot_name.lower()
-        ]
-        if not pilot_match.empty:
-            resolved['pilot'] = pilot_match.iloc[0].to_dict()
-        else:
-            resolved['pilot'] = None
-    
-    # Resolve drone
-    drone_id = params.get('drone_id')
-    if drone_id and context['drones_df'] is not None:
-        drone_match = context['drones_df'][
-            context['drones_df']['drone_id'].str.upper() == drone_id.upper()
-        ]
-        if not drone_match.empty:
-            resolved['drone'] = drone_match.iloc[0].to_dict()
-        else:
-            resolved['drone'] = None
-    
-    # Resolve mission
-    mission_id = params.get('mission_id')
-    if mission_id and context['missions_df'] is not None:
-        mission_match = context['missions_df'][
-            context['missions_df']['project_id'].str.upper() == mission_id.upper()
-        ]
-        if not mission_match.empty:
-            resolved['mission'] = mission_match.iloc[0].to_dict()
-        else:
-            resolved['mission'] = None
-    
-    # Resolve from_mission (for reassignment)
-    from_mission_id = params.get('from_mission_id')
-    if from_mission_id and context['missions_df'] is not None:
-        from_mission_match = context['missions_df'][
-            context['missions_df']['project_id'].str.upper() == from_mission_id.upper()
-        ]
-        if not from_mission_match.empty:
-            resolved['from_mission'] = from_mission_match.iloc[0].to_dict()
-        else:
-            resolved['from_mission'] = None
-    
-    # Resolve to_mission (for reassignment)
-    to_mission_id = params.get('to_mission_id')
-    if to_mission_id and context['missions_df'] is not None:
-        to_mission_match = context['missions_df'][
-            context['missions_df']['project_id'].str.upper() == to_mission_id.upper()
-        ]
-        if not to_mission_match.empty:
-            resolved['to_mission'] = to_mission_match.iloc[0].to_dict()
-        else:
-            resolved['to_mission'] = None
+    for role, sheet, param, column, case, fallback in lookups:
+        value = params.get(param)
+        df = context[f'{sheet}_df']
+        if not value or df is None:
+            continue
+        
+        row = _find_row(context, sheet, column, value, case, fallback)
+        rows[role] = row
+        if row is None:
+            resolved[role] = None
+            continue
+        
+        if (sheet, row) not in records:
+            records[(sheet, row)] = df.iloc[row].to_dict()
+        resolved[role] = records[(sheet, row)]
     
+    context['resolved_rows'] = rows
     return resolved
 
 
+def _issues_message(header: str, blocking_issues: List[str]) -> str:
+    """Join a header and its blocking issues into one message."""
+    return '\n'.join([header, ""] + [f"❌ {issue}" for issue in blocking_issues])
+
+
+def _append_warnings(parts: List[str], warnings: List[str]) -> None:
+    """Append a bulleted warnings block to message parts, if any."""
+    if warnings:
+        parts.extend(["", "⚠️  Warnings:"])
+        parts.extend(f"  • {w}" for w in warnings)
+
+
 def _validate_assignment_step(context: Dict) -> Dict:
     """
     Validate the assignment using the rules engine.
@@ -296,14 +689,12 @@ def _validate_assignment_step(context: Dict) -> Dict:
             'steps_taken': []
         }
     
-    # Run validation
+    # Run validation; the rules only inspect the resolved records, so the
+    # full tables are not converted to lists of dicts
     blocking_issues, warnings = validate_assignment(
         resolved['pilot'],
         resolved['drone'],
-        resolved['mission'],
-        context['pilots_df'].to_dict('records'),
-        context['drones_df'].to_dict('records'),
-        context['missions_df'].to_dict('records')
+        resolved['mission']
     )
     
     # Store validation results
@@ -314,12 +705,12 @@ def _validate_assignment_step(context: Dict) -> Dict:
     
     # If there are blocking issues, return failure
     if blocking_issues:
-        issues_text = '\n'.join([f"❌ {issue}" for issue in blocking_issues])
-        warnings_text = '\n'.join([f"⚠️  {warning}" for warning in warnings]) if warnings else ""
-        
-        message = f"Assignment validation failed:\n\n{issues_text}"
-        if warnings_text:
-            message += f"\n\nWarnings:\n{warnings_text}"
+        parts = ["Assignment validation failed:", ""]
+        parts.extend(f"❌ {issue}" for issue in blocking_issues)
+        if warnings:
+            parts.extend(["", "Warnings:"])
+            parts.extend(f"⚠️  {warning}" for warning in warnings)
+        message = '\n'.join(parts)
         
         return {
             'success': False,
@@ -346,37 +737,45 @@ def _execute_assignment(context: Dict, steps_taken: List[str]) -> Dict:
     drone = resolved['drone']
     mission = resolved['mission']
     
+    indexes = context['indexes']
+    rows = context['resolved_rows']
+    
     # Update pilot status
     pilots_df = context['pilots_df']
-    pilot_idx = pilots_df[pilots_df['pilot_id'] == pilot['pilot_id']].index[0]
-    pilots_df.at[pilot_idx, 'status'] = 'Assigned'
-    pilots_df.at[pilot_idx, 'current_assignment'] = mission['project_id']
+    _set_assignment(pilots_df, indexes['pilots'], rows['pilot'], mission['project_id'])
     
     # Update drone status
     drones_df = context['drones_df']
-    drone_idx = drones_df[drones_df['drone_id'] == drone['drone_id']].index[0]
-    drones_df.at[drone_idx, 'status'] = 'Assigned'
-    drones_df.at[drone_idx, 'current_assignment'] = mission['project_id']
+    _set_assignment(drones_df, indexes['drones'], rows['drone'], mission['project_id'])
+    
+    # Write back only the changed cells, in a single round-trip
+    from tools.sheets import SHEETS_ERRORS, batch_update_df_cells
     
-    # Write back to Google Sheets
-    spreadsheet_id = os.getenv('SPREADSHEET_ID')
+    try:
+        batch_update_df_cells(SPREADSHEET_ID, [
+            (PILOTS_SHEET_RANGE, pilots_df, _assignment_cells(rows['pilot'])),
+            (DRONES_SHEET_RANGE, drones_df, _assignment_cells(rows['drone']))
+        ])
+    except SHEETS_ERRORS as e:
+        return _sheets_error(e, steps_taken)
     
-    update_sheet_from_df(spreadsheet_id, os.getenv('PILOTS_SHEET_RANGE'), pilots_df)
-    update_sheet_from_df(spreadsheet_id, os.getenv('DRONES_SHEET_RANGE'), drones_df)
+    # The frames we just wrote are authoritative; refresh the cache with them
+    _store_sheet(PILOTS_SHEET_RANGE, pilots_df, _PILOT_KEYS)
+    _store_sheet(DRONES_SHEET_RANGE, drones_df, _DRONE_KEYS)
     
     # Build success message
     warnings = validation.get('warnings', [])
-    warnings_text = ""
-    if warnings:
-        warnings_text = "\n\n⚠️  Warnings:\n" + '\n'.join([f"  • {w}" for w in warnings])
-    
-    message = f"""✅ Assignment successful!
-
-Pilot: {pilot['name']} ({pilot['pilot_id']})
-Drone: {drone['drone_id']} ({drone['model']})
-Mission: {mission['project_id']} - {mission['client']}
-Location: {mission['location']}
-Duration: {mission['start_date']} to {mission['end_date']}{warnings_text}"""
+    parts = [
+        "✅ Assignment successful!",
+        "",
+        f"Pilot: {pilot['name']} ({pilot['pilot_id']})",
+        f"Drone: {drone['drone_id']} ({drone['model']})",
+        f"Mission: {mission['project_id']} - {mission['client']}",
+        f"Location: {mission['location']}",
+        f"Duration: {mission['start_date']} to {mission['end_date']}"
+    ]
+    _append_warnings(parts, warnings)
+    message = '\n'.join(parts)
     
     return {
         'success': True,
@@ -435,26 +834,14 @@ def _validate_reassignment_step(context: Dict, params: Dict) -> Dict:
     
     if pilot and to_mission:
         # Check if pilot has required skills for new mission
-        required_skills = set(to_mission.get('required_skills', '').split(','))
-        required_skills = {s.strip() for s in required_skills if s.strip()}
-        
-        pilot_skills = set(pilot.get('skills', '').split(','))
-        pilot_skills = {s.strip() for s in pilot_skills if s.strip()}
-        
-        missing_skills = required_skills - pilot_skills
+        missing_skills = missing_csv_items(to_mission.get('required_skills', ''), pilot.get('skills', ''))
         if missing_skills:
             blocking_issues.append(
                 f"Pilot {pilot.get('name')} lacks required skills for new mission: {', '.join(missing_skills)}"
             )
         
         # Check certifications
-        required_certs = set(to_mission.get('required_certs', '').split(','))
-        required_certs = {c.strip() for c in required_certs if c.strip()}
-        
-        pilot_certs = set(pilot.get('certifications', '').split(','))
-        pilot_certs = {c.strip() for c in pilot_certs if c.strip()}
-        
-        missing_certs = required_certs - pilot_certs
+        missing_certs = missing_csv_items(to_mission.get('required_certs', ''), pilot.get('certifications', ''))
         if missing_certs:
             blocking_issues.append(
                 f"Pilot {pilot.get('name')} lacks required certifications: {', '.join(missing_certs)}"
@@ -485,18 +872,16 @@ def _validate_reassignment_step(context: Dict, params: Dict) -> Dict:
     
     # If urgent mode, only hard blocks prevent reassignment
     if params.get('urgent') and blocking_issues:
-        issues_text = '\n'.join([f"❌ {issue}" for issue in blocking_issues])
         return {
             'success': False,
-            'message': f"Cannot complete urgent reassignment:\n\n{issues_text}",
+            'message': _issues_message("Cannot complete urgent reassignment:", blocking_issues),
             'data': {'blocking_issues': blocking_issues, 'warnings': warnings},
             'steps_taken': []
         }
     elif not params.get('urgent') and blocking_issues:
-        issues_text = '\n'.join([f"❌ {issue}" for issue in blocking_issues])
         return {
             'success': False,
-            'message': f"Reassignment validation failed:\n\n{issues_text}",
+            'message': _issues_message("Reassignment validation failed:", blocking_issues),
             'data': {'blocking_issues': blocking_issues, 'warnings': warnings},
             'steps_taken': []
         }
@@ -522,50 +907,53 @@ def _execute_reassignment(context: Dict, steps_taken: List[str]) -> Dict:
     # Track what was reassigned
     reassigned_resources = []
     
+    indexes = context['indexes']
+    rows = context['resolved_rows']
+    
     # Reassign pilot
     if pilot and pilots_df is not None:
-        pilot_idx = pilots_df[pilots_df['pilot_id'] == pilot['pilot_id']].index[0]
-        old_assignment = pilots_df.at[pilot_idx, 'current_assignment']
-        pilots_df.at[pilot_idx, 'current_assignment'] = to_mission['project_id']
-        pilots_df.at[pilot_idx, 'status'] = 'Assigned'
+        _set_assignment(pilots_df, indexes['pilots'], rows['pilot'], to_mission['project_id'])
         reassigned_resources.append(f"Pilot {pilot['name']} from {from_mission['project_id']} to {to_mission['project_id']}")
     
     # Reassign drone
     if drone and drones_df is not None:
-        drone_idx = drones_df[drones_df['drone_id'] == drone['drone_id']].index[0]
-        old_assignment = drones_df.at[drone_idx, 'current_assignment']
-        drones_df.at[drone_idx, 'current_assignment'] = to_mission['project_id']
-        drones_df.at[drone_idx, 'status'] = 'Assigned'
+        _set_assignment(drones_df, indexes['drones'], rows['drone'], to_mission['project_id'])
         reassigned_resources.append(f"Drone {drone['drone_id']} from {from_mission['project_id']} to {to_mission['project_id']}")
     
-    # Write back to Google Sheets
-    spreadsheet_id = os.getenv('SPREADSHEET_ID')
-    
+    # Write back only the changed cells, in a single round-trip
+    updates = []
     if pilot and pilots_df is not None:
-        update_sheet_from_df(spreadsheet_id, os.getenv('PILOTS_SHEET_RANGE'), pilots_df)
+        updates.append((PILOTS_SHEET_RANGE, pilots_df, _assignment_cells(rows['pilot'])))
+    if drone and drones_df is not None:
+        updates.append((DRONES_SHEET_RANGE, drones_df, _assignment_cells(rows['drone'])))
+    
+    if updates:
+        from tools.sheets import SHEETS_ERRORS, batch_update_df_cells
+        
+        try:
+            batch_update_df_cells(SPREADSHEET_ID, updates)
+        except SHEETS_ERRORS as e:
+            return _sheets_error(e, steps_taken)
     
+    if pilot and pilots_df is not None:
+        _store_sheet(PILOTS_SHEET_RANGE, pilots_df, _PILOT_KEYS)
     if drone and drones_df is not None:
-        update_sheet_from_df(spreadsheet_id, os.getenv('DRONES_SHEET_RANGE'), drones_df)
+        _store_sheet(DRONES_SHEET_RANGE, drones_df, _DRONE_KEYS)
     
     # Build success message
     warnings = validation.get('warnings', [])
-    warnings_text = ""
-    if warnings:
-        warnings_text = "\n\n⚠️  Warnings:\n" + '\n'.join([f"  • {w}" for w in warnings])
-    
-    reassignment_list = '\n'.join([f"  • {r}" for r in reassigned_resources])
-    
-    message = f"""🚨 Urgent Reassignment Completed!
-
-Reassigned:
-{reassignment_list}
-
-From Mission: {from_mission['project_id']} - {from_mission['client']}
-To Mission: {to_mission['project_id']} - {to_mission['client']}
-Target Location: {to_mission['location']}
-Duration: {to_mission['start_date']} to {to_mission['end_date']}{warnings_text}
-
-⚠️ Note: {from_mission['project_id']} may need new resource assignment."""
+    parts = ["🚨 Urgent Reassignment Completed!", "", "Reassigned:"]
+    parts.extend(f"  • {r}" for r in reassigned_resources)
+    parts.extend([
+        "",
+        f"From Mission: {from_mission['project_id']} - {from_mission['client']}",
+        f"To Mission: {to_mission['project_id']} - {to_mission['client']}",
+        f"Target Location: {to_mission['location']}",
+        f"Duration: {to_mission['start_date']} to {to_mission['end_date']}"
+    ])
+    _append_warnings(parts, warnings)
+    parts.extend(["", f"⚠️ Note: {from_mission['project_id']} may need new resource assignment."])
+    message = '\n'.join(parts)
     
     return {
         'success': True,
@@ -581,35 +969,86 @@ Duration: {to_mission['start_date']} to {to_mission['end_date']}{warnings_text}
     }
 
 
+def _sheet_totals(context: Dict, sheet: str) -> Optional[Tuple[int, int]]:
+    """
+    (row count, 'Available' count) for a sheet, or None if it has no rows.
+    
+    Summary plans only fetch counts (context['summary_counts']); otherwise
+    the counts come from the loaded frame and the status tallies cached
+    with its index (rebuilt on load and on every write-back). Sheets
+    without a status column (missions) report 0 available.
+    """
+    summary = context.get('summary_counts', {}).get(sheet)
+    if summary is not None:
+        total, counts = summary
+        return (total, int(counts.get('Available', 0))) if total else None
+    
+    df = context[f'{sheet}_df']
+    if df is None or df.empty:
+        return None
+    
+    counts = context['indexes'].get(sheet, {}).get(_STATUS_COUNTS)
+    if counts is None:
+        if 'status' not in df.columns:
+            return len(df), 0
+        return len(df), int((df['status'].to_numpy() == 'Available').sum())
+    return len(df), int(counts.get('Available', 0))
+
+
+def _records(df: pd.DataFrame, params: Dict) -> List[Dict]:
+    """
+    A table as JSON-serialisable records.
+    
+    All rows are returned unless step params set 'offset' and 'limit';
+    'columns' projects onto display columns.
+    """
+    offset = params.get('offset', 0)
+    limit = params.get('limit')
+    page = df.iloc[offset:] if limit is None else df.iloc[offset:offset + limit]
+    
+    columns = params.get('columns')
+    if columns:
+        page = page[[column for column in columns if column in page.columns]]
+    return page.to_dict('records')
+
+
 def _format_query_response(context: Dict, params: Dict, steps_taken: List[str]) -> Dict:
     """
     Format query results for display.
+    
+    data always carries '<sheet>_total' (and '<sheet>_available') counts;
+    record lists are included only when the step asks for them.
     """
     query_type = params.get('query_type', 'summary')
     entities = params.get('entities', {})
+    include_records = params.get('include_records', True)
     
     data = {}
     message_parts = []
     
     if query_type == 'pilots' or query_type == 'summary':
-        pilots_df = context['pilots_df']
-        if pilots_df is not None and not pilots_df.empty:
-            data['pilots'] = pilots_df.to_dict('records')
-            available_count = len(pilots_df[pilots_df['status'] == 'Available'])
-            message_parts.append(f"📋 **Pilots**: {len(pilots_df)} total, {available_count} available")
+        totals = _sheet_totals(context, 'pilots')
+        if totals is not None:
+            data['pilots_total'], data['pilots_available'] = totals
+            if include_records:
+                data['pilots'] = _records(context['pilots_df'], params)
+            message_parts.append(f"📋 **Pilots**: {totals[0]} total, {totals[1]} available")
     
     if query_type == 'drones' or query_type == 'summary':
-        drones_df = context['drones_df']
-        if drones_df is not None and not drones_df.empty:
-            data['drones'] = drones_df.to_dict('records')
-            available_count = len(drones_df[drones_df['status'] == 'Available'])
-            message_parts.append(f"🚁 **Drones**: {len(drones_df)} total, {available_count} available")
+        totals = _sheet_totals(context, 'drones')
+        if totals is not None:
+            data['drones_total'], data['drones_available'] = totals
+            if include_records:
+                data['drones'] = _records(context['drones_df'], params)
+            message_parts.append(f"🚁 **Drones**: {totals[0]} total, {totals[1]} available")
     
     if query_type == 'missions' or query_type == 'summary':
-        missions_df = context['missions_df']
-        if missions_df is not None and not missions_df.empty:
-            data['missions'] = missions_df.to_dict('records')
-            message_parts.append(f"📦 **Missions**: {len(missions_df)} active")
+        totals = _sheet_totals(context, 'missions')
+        if totals is not None:
+            data['missions_total'] = totals[0]
+            if include_records:
+                data['missions'] = _records(context['missions_df'], params)
+            message_parts.append(f"📦 **Missions**: {totals[0]} active")
     
     message = '\n'.join(message_parts) if message_parts else "No data found"
     
@@ -631,11 +1070,67 @@ def _format_confirmation(context: Dict, params: Dict, steps_taken: List[str]) ->
     return {
         'success': True,
         'message': f"Action '{action}' completed successfully",
-        'data': entities,
+        'data': dict(entities),
         'steps_taken': steps_taken
     }
 
 
+# Static help replies for the add_* intents
+_SHEET_URL = f"https://docs.google.com/spreadsheets/d/{SPREADSHEET_ID}"
+
+_ADD_PILOT_HELP = f'''To add a new pilot, please provide the following information:
+
+**Required:**
+- Name
+- Skills (comma-separated, e.g., "Mapping, Survey")
+- Certifications (comma-separated, e.g., "DGCA, Night Ops")
+- Location (e.g., "Bangalore")
+
+**Optional:**
+- Available from (date in DD-MM-YYYY format)
+
+**Example command:**
+"Add pilot Rajesh with skills Inspection,Thermal, certs DGCA,Night Ops, location Mumbai, available from 15-02-2026"
+
+Or you can directly add to the Google Sheet:
+{_SHEET_URL}'''
+
+_ADD_DRONE_HELP = f'''To add a new drone, please provide the following information:
+
+**Required:**
+- Model (e.g., "DJI Phantom 4 Pro")
+- Capabilities (comma-separated, e.g., "RGB, Thermal")
+- Location (e.g., "Bangalore")
+
+**Optional:**
+- Maintenance due (date in DD-MM-YYYY format)
+
+**Example command:**
+"Add drone DJI Mavic 3 Pro with capabilities RGB,LiDAR at location Bangalore, maintenance due 01-06-2026"
+
+Or you can directly add to the Google Sheet:
+{_SHEET_URL}'''
+
+_ADD_MISSION_HELP = f'''To add a new mission, please provide the following information:
+
+**Required:**
+- Client name
+- Location
+- Required skills (comma-separated)
+- Required certifications (comma-separated)
+- Start date (DD-MM-YYYY format)
+- End date (DD-MM-YYYY format)
+
+**Optional:**
+- Priority (High/Urgent/Standard)
+
+**Example command:**
+"Add mission for Client D at Hyderabad, requires Mapping,Survey skills, DGCA cert, from 20-02-2026 to 25-02-2026, priority High"
+
+Or you can directly add to the Google Sheet:
+{_SHEET_URL}'''
+
+
 def _parse_pilot_info(intent: Dict) -> Dict:
     """
     Parse pilot information from the original query.
@@ -656,22 +1151,7 @@ def _add_pilot_handler(context: Dict, steps_taken: List[str], intent: Dict) -> D
     # For command-line style, provide instruction message
     return {
         'success': False,
-        'message': '''To add a new pilot, please provide the following information:
-
-**Required:**
-- Name
-- Skills (comma-separated, e.g., "Mapping, Survey")
-- Certifications (comma-separated, e.g., "DGCA, Night Ops")
-- Location (e.g., "Bangalore")
-
-**Optional:**
-- Available from (date in DD-MM-YYYY format)
-
-**Example command:**
-"Add pilot Rajesh with skills Inspection,Thermal, certs DGCA,Night Ops, location Mumbai, available from 15-02-2026"
-
-Or you can directly add to the Google Sheet:
-https://docs.google.com/spreadsheets/d/{SPREADSHEET_ID}''',
+        'message': _ADD_PILOT_HELP,
         'data': None,
         'steps_taken': steps_taken
     }
@@ -693,21 +1173,7 @@ def _add_drone_handler(context: Dict, steps_taken: List[str], intent: Dict) -> D
     """
     return {
         'success': False,
-        'message': '''To add a new drone, please provide the following information:
-
-**Required:**
-- Model (e.g., "DJI Phantom 4 Pro")
-- Capabilities (comma-separated, e.g., "RGB, Thermal")
-- Location (e.g., "Bangalore")
-
-**Optional:**
-- Maintenance due (date in DD-MM-YYYY format)
-
-**Example command:**
-"Add drone DJI Mavic 3 Pro with capabilities RGB,LiDAR at location Bangalore, maintenance due 01-06-2026"
-
-Or you can directly add to the Google Sheet:
-https://docs.google.com/spreadsheets/d/{SPREADSHEET_ID}''',
+        'message': _ADD_DRONE_HELP,
         'data': None,
         'steps_taken': steps_taken
     }
@@ -729,25 +1195,135 @@ def _add_mission_handler(context: Dict, steps_taken: List[str], intent: Dict) ->
     """
     return {
         'success': False,
-        'message': '''To add a new mission, please provide the following information:
+        'message': _ADD_MISSION_HELP,
+        'data': None,
+        'steps_taken': steps_taken
+    }
 
-**Required:**
-- Client name
-- Location
-- Required skills (comma-separated)
-- Required certifications (comma-separated)
-- Start date (DD-MM-YYYY format)
-- End date (DD-MM-YYYY format)
 
-**Optional:**
-- Priority (High/Urgent/Standard)
+# ---------------------------------------------------------------------------
+# Tool dispatch
+#
+# Every handler takes (context, params, intent, steps_taken) and returns None
+# to continue with the next step, or a result dict that ends the plan.
+# ---------------------------------------------------------------------------
 
-**Example command:**
-"Add mission for Client D at Hyderabad, requires Mapping,Survey skills, DGCA cert, from 20-02-2026 to 25-02-2026, priority High"
+def _make_load_handler(tool: str):
+    """Build the handler for a single load_* step."""
+    sheet, loader = _LOADERS[tool]
+    
+    def handler(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+        from tools.sheets import SHEETS_ERRORS
+        
+        try:
+            result = loader()
+        except SHEETS_ERRORS as e:
+            return _sheets_error(e, steps_taken)
+        
+        context[f'{sheet}_df'], context['indexes'][sheet] = result
+        return None
+    
+    return handler
 
-Or you can directly add to the Google Sheet:
-https://docs.google.com/spreadsheets/d/{SPREADSHEET_ID}''',
+
+def _handle_batch_load(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+    from tools.sheets import SHEETS_ERRORS
+    
+    try:
+        loaded = _load_sheets(params['sheets'])
+    except SHEETS_ERRORS as e:
+        return _sheets_error(e, steps_taken)
+    
+    for sheet, (df, index) in loaded.items():
+        context[f'{sheet}_df'] = df
+        context['indexes'][sheet] = index
+    return None
+
+
+def _handle_load_summary_counts(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+    from tools.sheets import SHEETS_ERRORS
+    
+    try:
+        context['summary_counts'] = _load_summary_counts(params['sheets'])
+    except SHEETS_ERRORS as e:
+        return _sheets_error(e, steps_taken)
+    return None
+
+
+def _handle_resolve_entities(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+    context['resolved_entities'] = _resolve_entities(params, context)
+    return None
+
+
+def _handle_validate_assignment(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+    validation_result = _validate_assignment_step(context)
+    return None if validation_result['success'] else validation_result
+
+
+def _handle_validate_reassignment(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+    validation_result = _validate_reassignment_step(context, params)
+    return None if validation_result['success'] else validation_result
+
+
+def _handle_set_urgent_mode(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+    agent_state.set_urgent_mode(params.get('urgent', False))
+    return None
+
+
+def _handle_parse_pilot_info(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+    context['new_pilot_data'] = _parse_pilot_info(intent)
+    return None
+
+
+def _handle_parse_drone_info(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+    context['new_drone_data'] = _parse_drone_info(intent)
+    return None
+
+
+def _handle_parse_mission_info(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+    context['new_mission_data'] = _parse_mission_info(intent)
+    return None
+
+
+def _handle_unknown_intent(context: Dict, params: Dict, intent: Dict, steps_taken: List[str]) -> Optional[Dict]:
+    return {
+        'success': False,
+        'message': steps_taken[-1],
         'data': None,
         'steps_taken': steps_taken
     }
 
+
+_TOOL_HANDLERS = {
+    'load_pilots': _make_load_handler('load_pilots'),
+    'load_drones': _make_load_handler('load_drones'),
+    'load_missions': _make_load_handler('load_missions'),
+    'batch_load': _handle_batch_load,
+    'load_summary_counts': _handle_load_summary_counts,
+    'resolve_entities': _handle_resolve_entities,
+    'validate_assignment': _handle_validate_assignment,
+    'execute_assignment': lambda context, params, intent, steps: _execute_assignment(context, steps),
+    'validate_reassignment': _handle_validate_reassignment,
+    'execute_reassignment': lambda context, params, intent, steps: _execute_reassignment(context, steps),
+    'set_urgent_mode': _handle_set_urgent_mode,
+    'parse_pilot_info': _handle_parse_pilot_info,
+    'add_pilot': lambda context, params, intent, steps: _add_pilot_handler(context, steps, intent),
+    'parse_drone_info': _handle_parse_drone_info,
+    'add_drone': lambda context, params, intent, steps: _add_drone_handler(context, steps, intent),
+    'parse_mission_info': _handle_parse_mission_info,
+    'add_mission': lambda context, params, intent, steps: _add_mission_handler(context, steps, intent),
+    'format_query_response': lambda context, params, intent, steps: _format_query_response(context, params, steps),
+    'format_confirmation': lambda context, params, intent, steps: _format_confirmation(context, params, steps),
+    'unknown_intent': _handle_unknown_intent,
+}
+
+
+@lru_cache(maxsize=64)
+def _compile_plan(signature: Tuple[str, ...]) -> Tuple:
+    """
+    Resolve a plan's tool names to handlers once per plan shape.
+    
+    Plans of the same shape (e.g. every assignment) reuse the resolved
+    handler tuple; unknown tools map to None and are skipped.
+    """
+    return tuple(_TOOL_HANDLERS.get(tool) for tool in signature)
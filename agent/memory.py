@@ -6,13 +6,93 @@ Agent memory for maintaining conversational and operational state.
 This module stores:
 - Active mission context
 - Urgency flags
-- Last decision taken by the agent
+- A bounded history of compact decision records (the last one is the
+  agent's most recent decision)
 
-This is a lightweight in-memory state.
+This is a lightweight in-memory state. Records never hold sheet data, so
+the history stays small however long a session runs, and every update
+goes through a lock so concurrent requests cannot interleave writes.
 """
 
-agent_state = {
-    "active_mission": None,
-    "urgent_mode": False,
-    "last_decision": None
-}
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+
+# Number of recent decisions kept in agent_state.decisions
+HISTORY_SIZE = 50
+
+# Characters of the result message kept in each decision record
+SUMMARY_LENGTH = 200
+
+
+@dataclass(slots=True)
+class AgentMemory:
+    """
+    Process-wide agent state.
+
+    Fields can also be read with item access (agent_state['urgent_mode'])
+    for callers written against the original dict.
+    """
+    active_mission: Optional[str] = None
+    urgent_mode: bool = False
+    decisions: Deque[Dict] = field(default_factory=lambda: deque(maxlen=HISTORY_SIZE))
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def last_decision(self) -> Optional[Dict]:
+        """Most recent decision record, or None before the first request."""
+        with self._lock:
+            return self.decisions[-1] if self.decisions else None
+
+    @property
+    def history(self) -> List[Dict]:
+        """Snapshot of the recent decision records, oldest first."""
+        with self._lock:
+            return list(self.decisions)
+
+    def record_decision(self, query: str, intent: Dict, result: Dict) -> Dict:
+        """
+        Append a compact record of one agent run.
+
+        Only the query, intent and a truncated message are kept; the
+        result's data payload (sheet records) is deliberately dropped.
+
+        Args:
+            query: The user's query
+            intent: Parsed intent that was executed
+            result: Result dictionary returned by the agent
+
+        Returns:
+            The stored decision record
+        """
+        decision = {
+            'query': query,
+            'intent': intent,
+            'summary': (result.get('message') or '')[:SUMMARY_LENGTH],
+            'success': result.get('success')
+        }
+        with self._lock:
+            self.decisions.append(decision)
+        return decision
+
+    def set_urgent_mode(self, urgent: bool) -> None:
+        """Turn urgent reassignment mode on or off."""
+        with self._lock:
+            self.urgent_mode = urgent
+
+    def set_active_mission(self, mission_id: Optional[str]) -> None:
+        """Remember the mission the conversation is about."""
+        with self._lock:
+            self.active_mission = mission_id
+
+    def __getitem__(self, key: str):
+        if key.startswith('_'):
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+agent_state = AgentMemory()
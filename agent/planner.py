@@ -6,7 +6,10 @@ Planner module for SkyOps Agent.
 This module converts high-level intent into a sequence of execution steps.
 """
 
-from typing import Dict, List, Optional
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Hashable, List, Mapping, Optional, Tuple
 
 
 # Supported intents:
@@ -29,8 +32,9 @@ def plan(intent: Dict) -> List[Dict]:
             - parameters: Additional parameters for the action
     
     Returns:
-        List of execution steps, where each step is a dictionary with:
-            - tool: The tool to invoke (e.g., 'load_pilots', 'validate_assignment')
+        List of execution steps, where each step is a mapping with (steps
+        that do not depend on the intent are shared read-only templates):
+            - tool: The tool to invoke (e.g., 'load_pilots', 'batch_load', 'validate_assignment')
             - params: Parameters for the tool
             - description: Human-readable description of the step
     """
@@ -38,31 +42,141 @@ def plan(intent: Dict) -> List[Dict]:
     entities = intent.get('entities', {})
     parameters = intent.get('parameters', {})
     
-    if action == 'query_info':
-        return _plan_query_info(entities, parameters)
-    
-    elif action == 'assign_mission':
-        return _plan_assign_mission(entities, parameters)
-    
-    elif action == 'urgent_reassign':
-        return _plan_urgent_reassign(entities, parameters)
-    
-    elif action == 'add_pilot':
-        return _plan_add_pilot(entities, parameters)
-    
-    elif action == 'add_drone':
-        return _plan_add_drone(entities, parameters)
-    
-    elif action == 'add_mission':
-        return _plan_add_mission(entities, parameters)
-    
-    else:
+    planner = _PLANNERS.get(action)
+    if planner is None:
         # Unknown intent - return basic info query
         return [{
             'tool': 'unknown_intent',
             'params': {'intent': intent},
             'description': f"Unknown intent: {action}. Please clarify your request."
         }]
+    
+    return planner(entities, parameters)
+
+
+# Plans memoised by plan_cached(): frozen (action, entities, parameters) -> steps.
+# Oldest entries are evicted first once PLAN_CACHE_SIZE is reached; updates
+# go through a lock, since Streamlit sessions plan from several threads.
+PLAN_CACHE_SIZE = 256
+_PLAN_CACHE: Dict[Hashable, List[Dict]] = {}
+_PLAN_CACHE_LOCK = threading.Lock()
+
+
+def plan_cached(intent: Dict) -> List[Dict]:
+    """
+    Memoised plan(): repeated query shapes (e.g. dashboard summaries) reuse
+    the same step list.
+    
+    plan() is pure over the intent's action, entities and parameters, so
+    those form the cache key. The returned steps are shared between calls
+    and must be treated as read-only; intents that cannot be frozen into a
+    hashable key are planned directly.
+    
+    Args:
+        intent: Intent dictionary, as accepted by plan()
+    
+    Returns:
+        List of execution steps
+    """
+    try:
+        key = _freeze((intent.get('action', ''), intent.get('entities', {}), intent.get('parameters', {})))
+        steps = _PLAN_CACHE.get(key)
+    except TypeError:
+        return plan(intent)
+    
+    if steps is None:
+        steps = plan(intent)
+        with _PLAN_CACHE_LOCK:
+            if key not in _PLAN_CACHE and len(_PLAN_CACHE) >= PLAN_CACHE_SIZE:
+                _PLAN_CACHE.pop(next(iter(_PLAN_CACHE)), None)
+            steps = _PLAN_CACHE.setdefault(key, steps)
+    return steps
+
+
+def _freeze(value):
+    """Recursively convert dicts/lists into hashable tuples for cache keys."""
+    if isinstance(value, dict):
+        return ('__dict__',) + tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return ('__list__',) + tuple(_freeze(item) for item in value)
+    return value
+
+
+# Human-readable name of each sheet, for step descriptions
+_SHEET_LABELS = {
+    'pilots': 'pilot roster',
+    'drones': 'drone fleet',
+    'missions': 'missions',
+}
+
+
+def _sheets_text(sheets: Tuple[str, ...]) -> str:
+    """Human-readable list of sheets ('pilot roster, drone fleet and missions')."""
+    labels = [_SHEET_LABELS[sheet] for sheet in sheets]
+    if len(labels) == 1:
+        return labels[0]
+    return f"{', '.join(labels[:-1])} and {labels[-1]}"
+
+
+def _static_step(tool: str, params: Dict, description: str) -> Mapping:
+    """
+    Build a read-only step template, shared by every plan that uses it.
+    
+    Steps whose content does not depend on the intent are created once;
+    MappingProxyType makes accidental mutation of a shared step an error.
+    """
+    return MappingProxyType({
+        'tool': tool,
+        'params': MappingProxyType(params),
+        'description': description
+    })
+
+
+_URGENT_ON_STEP = _static_step('set_urgent_mode', {'urgent': True}, 'Activating urgent reassignment mode')
+_URGENT_OFF_STEP = _static_step('set_urgent_mode', {'urgent': False}, 'Deactivating urgent mode')
+_CONFIRM_ADD_STEPS = {
+    action: _static_step('format_confirmation', {'action': action}, 'Formatting confirmation message')
+    for action in ('add_pilot', 'add_drone', 'add_mission')
+}
+
+
+@lru_cache(maxsize=None)
+def _load_step(sheets: Tuple[str, ...]) -> Mapping:
+    """
+    Build the (shared, read-only) step that loads the given sheets.
+    
+    A single sheet uses its load_* tool; several sheets are fetched together
+    by one 'batch_load' step (a single Sheets batchGet round-trip).
+    """
+    if len(sheets) == 1:
+        return _static_step(f'load_{sheets[0]}', {}, f'Loading {_sheets_text(sheets)} from Google Sheets')
+    
+    return _static_step('batch_load', {'sheets': sheets}, f'Loading {_sheets_text(sheets)} from Google Sheets')
+
+
+def _entity_sheets(entities: Dict, sheet_entities: List[Tuple[str, Tuple[str, ...]]]) -> Tuple[str, ...]:
+    """
+    Sheets referenced by the intent's entities, in load order.
+    
+    Args:
+        entities: Extracted entities from the intent
+        sheet_entities: (sheet, entity keys) pairs; a sheet is needed if any
+            of its keys has a value
+    
+    Returns:
+        Sheet names to load, or all of them if no entity was given
+    """
+    sheets = tuple(
+        sheet for sheet, keys in sheet_entities
+        if any(entities.get(key) for key in keys)
+    )
+    return sheets or tuple(sheet for sheet, _ in sheet_entities)
+
+
+@lru_cache(maxsize=None)
+def _summary_counts_step(sheets: Tuple[str, ...]) -> Mapping:
+    """Build the (shared, read-only) step that counts rows for a summary."""
+    return _static_step('load_summary_counts', {'sheets': sheets}, f'Counting {_sheets_text(sheets)} records in Google Sheets')
 
 
 def _plan_query_info(entities: Dict, parameters: Dict) -> List[Dict]:
@@ -73,53 +187,35 @@ def _plan_query_info(entities: Dict, parameters: Dict) -> List[Dict]:
     query_type = parameters.get('query_type', 'summary')
     
     # Step 1: Load relevant data
+    sheets = []
     if 'pilot_name' in entities or query_type == 'pilots':
-        steps.append({
-            'tool': 'load_pilots',
-            'params': {},
-            'description': 'Loading pilot roster from Google Sheets'
-        })
+        sheets.append('pilots')
     
     if 'drone_id' in entities or query_type == 'drones':
-        steps.append({
-            'tool': 'load_drones',
-            'params': {},
-            'description': 'Loading drone fleet from Google Sheets'
-        })
+        sheets.append('drones')
     
     if 'mission_id' in entities or query_type == 'missions':
-        steps.append({
-            'tool': 'load_missions',
-            'params': {},
-            'description': 'Loading missions from Google Sheets'
-        })
+        sheets.append('missions')
     
     # If no specific query, load all data for summary
-    if not steps:
-        steps.extend([
-            {
-                'tool': 'load_pilots',
-                'params': {},
-                'description': 'Loading pilot roster'
-            },
-            {
-                'tool': 'load_drones',
-                'params': {},
-                'description': 'Loading drone fleet'
-            },
-            {
-                'tool': 'load_missions',
-                'params': {},
-                'description': 'Loading missions'
-            }
-        ])
+    if not sheets:
+        sheets = ['pilots', 'drones', 'missions']
+    sheets = tuple(sheets)
+    
+    if query_type == 'summary':
+        # Summaries only need row and status counts: read one column per sheet
+        steps.append(_summary_counts_step(sheets))
+    else:
+        steps.append(_load_step(sheets))
     
     # Step 2: Filter and format the response
+    # Summaries only need counts; full record tables are for specific queries
     steps.append({
         'tool': 'format_query_response',
         'params': {
             'entities': entities,
-            'query_type': query_type
+            'query_type': query_type,
+            'include_records': query_type != 'summary'
         },
         'description': 'Formatting response for user'
     })
@@ -133,24 +229,13 @@ def _plan_assign_mission(entities: Dict, parameters: Dict) -> List[Dict]:
     """
     steps = []
     
-    # Step 1: Load all data
-    steps.extend([
-        {
-            'tool': 'load_pilots',
-            'params': {},
-            'description': 'Loading pilot roster'
-        },
-        {
-            'tool': 'load_drones',
-            'params': {},
-            'description': 'Loading drone fleet'
-        },
-        {
-            'tool': 'load_missions',
-            'params': {},
-            'description': 'Loading missions'
-        }
-    ])
+    # Step 1: Load the sheets the entities refer to. A missing entity fails
+    # validation before its sheet would be read, so it is not fetched.
+    steps.append(_load_step(_entity_sheets(entities, [
+        ('pilots', ('pilot_name',)),
+        ('drones', ('drone_id',)),
+        ('missions', ('mission_id',)),
+    ])))
     
     # Step 2: Resolve entities (find the specific pilot, drone, mission)
     steps.append({
@@ -205,30 +290,15 @@ def _plan_urgent_reassign(entities: Dict, parameters: Dict) -> List[Dict]:
     steps = []
     
     # Step 1: Set urgent mode in agent memory
-    steps.append({
-        'tool': 'set_urgent_mode',
-        'params': {'urgent': True},
-        'description': 'Activating urgent reassignment mode'
-    })
+    steps.append(_URGENT_ON_STEP)
     
-    # Step 2: Load all data
-    steps.extend([
-        {
-            'tool': 'load_pilots',
-            'params': {},
-            'description': 'Loading pilot roster'
-        },
-        {
-            'tool': 'load_drones',
-            'params': {},
-            'description': 'Loading drone fleet'
-        },
-        {
-            'tool': 'load_missions',
-            'params': {},
-            'description': 'Loading missions'
-        }
-    ])
+    # Step 2: Load the sheets the entities refer to; only the resource being
+    # moved (pilot and/or drone) is written back
+    steps.append(_load_step(_entity_sheets(entities, [
+        ('pilots', ('pilot_name',)),
+        ('drones', ('drone_id',)),
+        ('missions', ('from_mission_id', 'to_mission_id')),
+    ])))
     
     # Step 3: Identify the resource to reassign
     steps.append({
@@ -268,11 +338,7 @@ def _plan_urgent_reassign(entities: Dict, parameters: Dict) -> List[Dict]:
     })
     
     # Step 6: Clear urgent mode
-    steps.append({
-        'tool': 'set_urgent_mode',
-        'params': {'urgent': False},
-        'description': 'Deactivating urgent mode'
-    })
+    steps.append(_URGENT_OFF_STEP)
     
     # Step 7: Confirm to user
     steps.append({
@@ -308,11 +374,7 @@ def _plan_add_pilot(entities: Dict, parameters: Dict) -> List[Dict]:
     })
     
     # Step 3: Confirm addition
-    steps.append({
-        'tool': 'format_confirmation',
-        'params': {'action': 'add_pilot'},
-        'description': 'Formatting confirmation message'
-    })
+    steps.append(_CONFIRM_ADD_STEPS['add_pilot'])
     
     return steps
 
@@ -338,11 +400,7 @@ def _plan_add_drone(entities: Dict, parameters: Dict) -> List[Dict]:
     })
     
     # Step 3: Confirm addition
-    steps.append({
-        'tool': 'format_confirmation',
-        'params': {'action': 'add_drone'},
-        'description': 'Formatting confirmation message'
-    })
+    steps.append(_CONFIRM_ADD_STEPS['add_drone'])
     
     return steps
 
@@ -368,15 +426,27 @@ def _plan_add_mission(entities: Dict, parameters: Dict) -> List[Dict]:
     })
     
     # Step 3: Confirm addition
-    steps.append({
-        'tool': 'format_confirmation',
-        'params': {'action': 'add_mission'},
-        'description': 'Formatting confirmation message'
-    })
+    steps.append(_CONFIRM_ADD_STEPS['add_mission'])
     
     return steps
 
 
+# Intent action -> planner function
+_PLANNERS = {
+    'query_info': _plan_query_info,
+    'assign_mission': _plan_assign_mission,
+    'urgent_reassign': _plan_urgent_reassign,
+    'add_pilot': _plan_add_pilot,
+    'add_drone': _plan_add_drone,
+    'add_mission': _plan_add_mission,
+}
+
+# Supported actions: ordered for messages, frozen for membership checks
+_INTENT_ORDER: Tuple[str, ...] = tuple(_PLANNERS)
+_SUPPORTED_INTENTS: FrozenSet[str] = frozenset(_PLANNERS)
+_SUPPORTED_TEXT = ', '.join(_INTENT_ORDER)
+
+
 def get_supported_intents() -> List[str]:
     """
     Return list of supported intent actions.
@@ -384,7 +454,7 @@ def get_supported_intents() -> List[str]:
     Returns:
         List of supported intent action names
     """
-    return ['query_info', 'assign_mission', 'urgent_reassign', 'add_pilot', 'add_drone', 'add_mission']
+    return list(_INTENT_ORDER)
 
 
 def validate_intent(intent: Dict) -> tuple[bool, Optional[str]]:
@@ -404,8 +474,8 @@ def validate_intent(intent: Dict) -> tuple[bool, Optional[str]]:
         return False, "Intent must have an 'action' field"
     
     action = intent.get('action', '').lower()
-    if action not in get_supported_intents():
-        return False, f"Unsupported action: {action}. Supported: {', '.join(get_supported_intents())}"
+    if action not in _SUPPORTED_INTENTS:
+        return False, f"Unsupported action: {action}. Supported: {_SUPPORTED_TEXT}"
     
     if 'entities' not in intent:
         return False, "Intent must have an 'entities' field"
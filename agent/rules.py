@@ -15,8 +15,153 @@ Warning rules:
 - Location mismatch
 """
 
+import threading
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple, Optional
+
+
+# Placeholder values the sheets use for "no current assignment", compared
+# after strip() and casefold(). Dashes come in several forms, including the
+# en-dash mis-decoded as 'â€"' (see DECISION_LOG.md); any value of
+# UNASSIGNED_MAX_LEN characters or fewer also counts, since real
+# assignments are project IDs such as 'PRJ001'.
+UNASSIGNED: FrozenSet[str] = frozenset({
+    '', '-', '--', '–', '—', 'â€"', 'â€“', 'none', 'null', 'n/a', 'tbd', 'nan', '<na>'
+})
+UNASSIGNED_MAX_LEN = 3
+
+
+def is_unassigned(value) -> bool:
+    """
+    Check whether a current_assignment cell means "not assigned".
+    
+    Every value is judged by its text, so a numeric cell (12) is classified
+    like the same string ('12'). None, NaN and pd.NA become 'None', 'nan'
+    and '<NA>', which also avoids pd.NA's ambiguous truth value.
+    
+    Args:
+        value: Cell value (None and NaN count as empty)
+        
+    Returns:
+        True if the cell is short (UNASSIGNED_MAX_LEN characters or fewer)
+        or one of the UNASSIGNED placeholders
+    """
+    text = str(value).strip()
+    return len(text) <= UNASSIGNED_MAX_LEN or text.casefold() in UNASSIGNED
+
+
+# Skills and certifications form small vocabularies, so each token gets a
+# bit and a cell becomes an int mask: subset checks are one `&` and missing
+# items are `required & ~held`. Bits are assigned on first sight, under a
+# lock so concurrent requests cannot hand two tokens the same bit.
+_TOKEN_BITS: Dict[str, int] = {}
+_BIT_TOKENS: List[str] = []
+_TOKEN_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def parse_csv_set(value: str) -> FrozenSet[str]:
+    """
+    Parse a comma-separated sheet cell (skills, certs) into a frozenset.
+    
+    Sheet cells repeat heavily across rows and requests, so parsed values
+    are memoised; the result is immutable and safe to share.
+    
+    Args:
+        value: Cell text, e.g. "Mapping, Survey"
+    
+    Returns:
+        Frozenset of stripped, non-empty entries
+    """
+    return frozenset(item.strip() for item in (value or '').split(',') if item.strip())
+
+
+@lru_cache(maxsize=4096)
+def csv_mask(value: str) -> int:
+    """
+    Bitmask of the tokens in a comma-separated sheet cell.
+    
+    Args:
+        value: Cell text, e.g. "Mapping, Survey"
+    
+    Returns:
+        Int with one bit set per distinct token (0 for an empty cell)
+    """
+    mask = 0
+    for token in parse_csv_set(value):
+        bit = _TOKEN_BITS.get(token)
+        if bit is None:
+            with _TOKEN_LOCK:
+                bit = _TOKEN_BITS.get(token)
+                if bit is None:
+                    bit = 1 << len(_BIT_TOKENS)
+                    _TOKEN_BITS[token] = bit
+                    _BIT_TOKENS.append(token)
+        mask |= bit
+    return mask
+
+
+@lru_cache(maxsize=4096)
+def parse_csv_list(value: str) -> Tuple[str, ...]:
+    """
+    Entries of a comma-separated sheet cell in the order they are listed.
+    
+    Args:
+        value: Cell text, e.g. "Mapping, Survey"
+    
+    Returns:
+        Tuple of stripped, non-empty entries
+    """
+    return tuple(item.strip() for item in (value or '').split(',') if item.strip())
+
+
+def csv_items(value: str, mask: int) -> List[str]:
+    """
+    Entries of a cell whose csv_mask bits are set in mask, in cell order.
+    
+    Args:
+        value: Cell text, e.g. a mission's required_skills
+        mask: Bitmask selecting entries (e.g. required & ~held)
+    
+    Returns:
+        List of the selected entries, as listed in the cell
+    """
+    csv_mask(value)  # gives the cell's new tokens their bits
+    return [item for item in parse_csv_list(value) if _TOKEN_BITS[item] & mask]
+
+
+def missing_csv_items(required: str, held: str) -> List[str]:
+    """
+    Tokens of the required cell that the held cell lacks.
+    
+    Args:
+        required: Requirement cell, e.g. a mission's required_skills
+        held: Cell to check, e.g. a pilot's skills
+    
+    Returns:
+        Missing tokens in the required cell's order (empty if all are held)
+    """
+    return csv_items(required, ~csv_mask(held))
+
+
+@lru_cache(maxsize=8192)
+def parse_ddmmyyyy(value: str) -> datetime:
+    """
+    Parse a DD-MM-YYYY sheet date, memoised per string.
+    
+    The same few dates (mission windows, maintenance due dates) are parsed
+    over and over by the validators and suggesters. The fixed layout is
+    split by hand rather than through strptime, which re-interprets the
+    format string on every call.
+    
+    Raises:
+        ValueError: If the value is not a DD-MM-YYYY date
+    """
+    day, month, year = value.split('-')
+    if len(year) != 4 or not (day + month + year).isdigit():
+        raise ValueError(f"time data {value!r} does not match format '%d-%m-%Y'")
+    return datetime(int(year), int(month), int(day))
 
 
 def validate_assignment(
@@ -43,6 +188,53 @@ def validate_assignment(
         - blocking_issues: List of critical errors that prevent assignment
         - warnings: List of non-critical concerns
     """
+    key = (
+        _freeze_record(pilot, _PILOT_FIELDS),
+        _freeze_record(drone, _DRONE_FIELDS),
+        _freeze_record(mission, _MISSION_FIELDS)
+    )
+    try:
+        blocking_issues, warnings = _validate_cached(*key)
+    except TypeError:
+        # Unhashable cell values; validate without the cache
+        return _validate(pilot, drone, mission)
+    
+    # Fresh lists so callers can extend them without touching the cache
+    return list(blocking_issues), list(warnings)
+
+
+# Fields validate_assignment reads from each record; the cache is keyed on
+# their values, so an edited sheet row simply produces a new key
+_PILOT_FIELDS = ('name', 'status', 'current_assignment', 'skills', 'certifications', 'location', 'available_from')
+_DRONE_FIELDS = ('drone_id', 'status', 'current_assignment', 'maintenance_due', 'location')
+_MISSION_FIELDS = ('required_skills', 'required_certs', 'start_date', 'end_date', 'location')
+
+VALIDATION_CACHE_SIZE = 1024
+
+
+def _freeze_record(record: Dict, fields: Tuple[str, ...]) -> Tuple:
+    """
+    Hashable (field, value) pairs for the fields present in a record.
+    
+    Absent fields are left out rather than defaulted, so the rules still
+    see exactly the .get() fallbacks they would on the original dict.
+    """
+    return tuple((name, record[name]) for name in fields if name in record)
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_cached(pilot: Tuple, drone: Tuple, mission: Tuple) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Memoised _validate over frozen records (see _freeze_record).
+    """
+    blocking_issues, warnings = _validate(dict(pilot), dict(drone), dict(mission))
+    return tuple(blocking_issues), tuple(warnings)
+
+
+def _validate(pilot: Dict, drone: Dict, mission: Dict) -> Tuple[List[str], List[str]]:
+    """
+    Run the blocking and warning rules for one assignment.
+    """
     blocking_issues = []
     warnings = []
     
@@ -52,24 +244,14 @@ def validate_assignment(
         blocking_issues.append(f"Pilot {pilot.get('name')} is not available (status: {status})")
     
     # BLOCKING RULE 2: Check if pilot has required skills
-    required_skills = mission.get('required_skills', '').split(',')
-    required_skills = [s.strip() for s in required_skills if s.strip()]
-    pilot_skills = pilot.get('skills', '').split(',')
-    pilot_skills = [s.strip() for s in pilot_skills if s.strip()]
-    
-    missing_skills = [skill for skill in required_skills if skill not in pilot_skills]
+    missing_skills = missing_csv_items(mission.get('required_skills', ''), pilot.get('skills', ''))
     if missing_skills:
         blocking_issues.append(
             f"Pilot {pilot.get('name')} lacks required skills: {', '.join(missing_skills)}"
         )
     
     # BLOCKING RULE 3: Check if pilot has required certifications
-    required_certs = mission.get('required_certs', '').split(',')
-    required_certs = [c.strip() for c in required_certs if c.strip()]
-    pilot_certs = pilot.get('certifications', '').split(',')
-    pilot_certs = [c.strip() for c in pilot_certs if c.strip()]
-    
-    missing_certs = [cert for cert in required_certs if cert not in pilot_certs]
+    missing_certs = missing_csv_items(mission.get('required_certs', ''), pilot.get('certifications', ''))
     if missing_certs:
         blocking_issues.append(
             f"Pilot {pilot.get('name')} lacks required certifications: {', '.join(missing_certs)}"
@@ -82,27 +264,13 @@ def validate_assignment(
         )
     
     # BLOCKING RULE 5: Check if drone is already assigned
-    drone_assignment = str(drone.get('current_assignment', '')).strip()
-    # Consider empty, short non-alphanumeric strings, or 'None' as "not assigned"
-    is_drone_assigned = (
-        drone_assignment and 
-        len(drone_assignment) > 3 and 
-        drone_assignment not in ['None', 'none', 'null', 'NULL']
-    )
-    if is_drone_assigned:
+    if not is_unassigned(drone.get('current_assignment')):
         blocking_issues.append(
             f"Drone {drone.get('drone_id')} is already assigned to {drone.get('current_assignment')}"
         )
     
     # BLOCKING RULE 6: Check if pilot is already assigned (double-booking)
-    pilot_assignment = str(pilot.get('current_assignment', '')).strip()
-    # Consider empty, short non-alphanumeric strings, or 'None' as "not assigned"
-    is_pilot_assigned = (
-        pilot_assignment and 
-        len(pilot_assignment) > 3 and 
-        pilot_assignment not in ['None', 'none', 'null', 'NULL']
-    )
-    if is_pilot_assigned:
+    if not is_unassigned(pilot.get('current_assignment')):
         blocking_issues.append(
             f"Pilot {pilot.get('name')} is already assigned to {pilot.get('current_assignment')}"
         )
@@ -115,9 +283,9 @@ def validate_assignment(
         
         if maintenance_due and mission_start and mission_end:
             # Parse dates (assuming DD-MM-YYYY format)
-            maint_date = datetime.strptime(maintenance_due, '%d-%m-%Y')
-            start_date = datetime.strptime(mission_start, '%d-%m-%Y')
-            end_date = datetime.strptime(mission_end, '%d-%m-%Y')
+            maint_date = parse_ddmmyyyy(maintenance_due)
+            start_date = parse_ddmmyyyy(mission_start)
+            end_date = parse_ddmmyyyy(mission_end)
             
             if maint_date < end_date:
                 blocking_issues.append(
@@ -148,8 +316,8 @@ def validate_assignment(
         mission_start = mission.get('start_date', '')
         
         if available_from and mission_start:
-            avail_date = datetime.strptime(available_from, '%d-%m-%Y')
-            start_date = datetime.strptime(mission_start, '%d-%m-%Y')
+            avail_date = parse_ddmmyyyy(available_from)
+            start_date = parse_ddmmyyyy(mission_start)
             
             if avail_date > start_date:
                 warnings.append(
@@ -174,26 +342,20 @@ def check_mission_feasibility(mission: Dict, all_pilots: List[Dict], all_drones:
     Returns:
         Dictionary with feasibility status and available resources
     """
-    available_pilots = [p for p in all_pilots if p.get('status', '').lower() == 'available']
     available_drones = [d for d in all_drones if d.get('status', '').lower() == 'available']
     
-    # Filter pilots by required skills and certs
-    required_skills = set(mission.get('required_skills', '').split(','))
-    required_skills = {s.strip() for s in required_skills if s.strip()}
-    
-    required_certs = set(mission.get('required_certs', '').split(','))
-    required_certs = {c.strip() for c in required_certs if c.strip()}
+    # Filter available pilots by required skills and certs in one pass.
+    # Skills and certs share one bit vocabulary, so the two masks are kept
+    # apart: a cert listed under a pilot's skills must not count.
+    required_skills = csv_mask(mission.get('required_skills', ''))
+    required_certs = csv_mask(mission.get('required_certs', ''))
     
-    qualified_pilots = []
-    for pilot in available_pilots:
-        pilot_skills = set(pilot.get('skills', '').split(','))
-        pilot_skills = {s.strip() for s in pilot_skills if s.strip()}
-        
-        pilot_certs = set(pilot.get('certifications', '').split(','))
-        pilot_certs = {c.strip() for c in pilot_certs if c.strip()}
-        
-        if required_skills.issubset(pilot_skills) and required_certs.issubset(pilot_certs):
-            qualified_pilots.append(pilot)
+    qualified_pilots = [
+        pilot for pilot in all_pilots
+        if pilot.get('status', '').lower() == 'available'
+        and not required_skills & ~csv_mask(pilot.get('skills', ''))
+        and not required_certs & ~csv_mask(pilot.get('certifications', ''))
+    ]
     
     return {
         'feasible': len(qualified_pilots) > 0 and len(available_drones) > 0,
@@ -4,118 +4,185 @@
 Suggestion engine for finding alternative pilots/drones when assignment fails.
 """
 
-from typing import Dict, List, Tuple
+import heapq
+from typing import Dict, Iterator, List, Tuple, Union
+import numpy as np
 import pandas as pd
 
+from agent.rules import UNASSIGNED, UNASSIGNED_MAX_LEN, csv_items, csv_mask, is_unassigned, parse_ddmmyyyy
+
+
+# Columns the pilot scorer reads; absent ones are treated as empty cells
+_PILOT_COLUMNS = ('pilot_id', 'status', 'current_assignment', 'skills', 'certifications', 'location')
+
 
 def suggest_alternative_pilots(
     mission: Dict,
-    all_pilots: List[Dict],
+    all_pilots: Union[List[Dict], pd.DataFrame],
     current_pilot: Dict = None,
     top_n: int = 3
 ) -> List[Dict]:
     """
     Suggest alternative pilots for a mission based on availability and requirements.
     
+    Every pilot is filtered and scored in one vectorised pass over the
+    roster; match details are only built for the top_n suggestions.
+    
     Args:
         mission: Mission information dictionary
-        all_pilots: List of all pilot records
+        all_pilots: All pilot records (list of dicts, or the roster DataFrame)
         current_pilot: The pilot that was attempted (to exclude from suggestions)
         top_n: Number of top suggestions to return
     
     Returns:
         List of suggested pilots with match scores
     """
-    suggestions = []
+    # Requirements as bitmasks (see agent.rules.csv_mask)
+    required_skills = csv_mask(mission.get('required_skills', ''))
+    required_certs = csv_mask(mission.get('required_certs', ''))
+    skill_count = required_skills.bit_count()
+    cert_count = required_certs.bit_count()
     
-    required_skills = mission.get('required_skills', '').split(',')
-    required_skills = [s.strip() for s in required_skills if s.strip()]
+    mission_location = mission.get('location', '').strip()
     
-    required_certs = mission.get('required_certs', '').split(',')
-    required_certs = [c.strip() for c in required_certs if c.strip()]
+    pilots_df = _as_frame(all_pilots, _PILOT_COLUMNS)
+    if pilots_df.empty:
+        return []
     
-    mission_location = mission.get('location', '').strip()
+    # Step 1: Only consider available pilots without assignments
+    assignment = pilots_df['current_assignment']
+    eligible = (
+        (pilots_df['status'].str.lower() == 'available')
+        & _unassigned_mask(assignment)
+    )
     
-    for pilot in all_pilots:
-        # Skip the current pilot if provided
-        if current_pilot and pilot.get('pilot_id') == current_pilot.get('pilot_id'):
-            continue
-        
-        # Only consider available pilots without assignments
-        if pilot.get('status', '').lower() != 'available':
-            continue
-        
-        current_assignment = pilot.get('current_assignment', '')
-        if current_assignment and current_assignment not in ['–', '-', 'None', '', 'none']:
-            continue
-        
-        # Calculate match score
-        score = 0
-        match_details = []
-        missing_items = []
-        
-        # Check skills
-        pilot_skills = pilot.get('skills', '').split(',')
-        pilot_skills = [s.strip() for s in pilot_skills if s.strip()]
-        
-        matched_skills = [skill for skill in required_skills if skill in pilot_skills]
-        missing_skills = [skill for skill in required_skills if skill not in pilot_skills]
-        
-        if required_skills:
-            skill_match_rate = len(matched_skills) / len(required_skills)
-            score += skill_match_rate * 40  # Skills worth 40 points
-            
-            if matched_skills:
-                match_details.append(f"Has skills: {', '.join(matched_skills)}")
-            if missing_skills:
-                missing_items.append(f"Missing skills: {', '.join(missing_skills)}")
-        
-        # Check certifications
-        pilot_certs = pilot.get('certifications', '').split(',')
-        pilot_certs = [c.strip() for c in pilot_certs if c.strip()]
-        
-        matched_certs = [cert for cert in required_certs if cert in pilot_certs]
-        missing_certs = [cert for cert in required_certs if cert not in pilot_certs]
-        
-        if required_certs:
-            cert_match_rate = len(matched_certs) / len(required_certs)
-            score += cert_match_rate * 40  # Certifications worth 40 points
-            
-            if matched_certs:
-                match_details.append(f"Has certs: {', '.join(matched_certs)}")
-            if missing_certs:
-                missing_items.append(f"Missing certs: {', '.join(missing_certs)}")
+    # Skip the current pilot if provided
+    if current_pilot:
+        eligible &= pilots_df['pilot_id'] != current_pilot.get('pilot_id')
+    
+    # Step 2: Score skills (40), certifications (40) and location (20)
+    skill_hits = _hit_counts(pilots_df['skills'], required_skills)
+    cert_hits = _hit_counts(pilots_df['certifications'], required_certs)
+    
+    scores = np.zeros(len(pilots_df))
+    if skill_count:
+        scores += skill_hits / skill_count * 40
+    if cert_count:
+        scores += cert_hits / cert_count * 40
+    if mission_location:
+        mission_key = mission_location.casefold()
+        scores += 20 * (pilots_df['location'].str.strip().str.casefold() == mission_key).to_numpy()
+    
+    # Step 3: Keep fully qualified pilots, or partial matches of at least 50%
+    fully_qualified = (skill_hits == skill_count) & (cert_hits == cert_count)
+    candidates = np.flatnonzero(eligible.to_numpy() & (fully_qualified | (scores >= 40)))
+    
+    # Step 4: Highest scores first (stable, so ties keep roster order)
+    ranked = candidates[np.argsort(-scores[candidates], kind='stable')][:top_n]
+    
+    return [
+        _pilot_suggestion(_record(all_pilots, position), mission, required_skills, required_certs, mission_location)
+        for position in ranked
+    ]
+
+
+def _hit_counts(cells: pd.Series, required: int) -> np.ndarray:
+    """
+    How many of the required bits each cell's csv_mask holds.
+    
+    Masks are ANDed with the requirement first, so they fit in uint64 for
+    any vocabulary of up to 64 tokens and numpy can popcount the column in
+    one call; larger vocabularies fall back to int.bit_count per cell.
+    """
+    held = cells.map(csv_mask).to_numpy(dtype=object) & required
+    if required < 1 << 64 and hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(held.astype(np.uint64)).astype(np.int64)
+    return np.fromiter((mask.bit_count() for mask in held), dtype=np.int64, count=len(held))
+
+
+def _pilot_suggestion(pilot: Dict, mission: Dict, required_skills: int, required_certs: int, mission_location: str) -> Dict:
+    """
+    Build the suggestion entry (score and match details) for one pilot.
+    
+    Requirements are csv_mask bitmasks of the mission's skills and certs;
+    matched and missing items are listed in the mission's order.
+    """
+    score = 0
+    match_details = []
+    missing_items = []
+    
+    # Check skills; names are only expanded for masks that are non-empty
+    mission_skills = mission.get('required_skills', '')
+    pilot_skills = csv_mask(pilot.get('skills', ''))
+    matched_skills = required_skills & pilot_skills
+    missing_skills = required_skills & ~pilot_skills
+    
+    if required_skills:
+        skill_match_rate = matched_skills.bit_count() / required_skills.bit_count()
+        score += skill_match_rate * 40  # Skills worth 40 points
         
-        # Check location
-        pilot_location = pilot.get('location', '').strip()
-        if pilot_location and mission_location:
-            if pilot_location.lower() == mission_location.lower():
-                score += 20  # Location match worth 20 points
-                match_details.append(f"Same location ({pilot_location})")
-            else:
-                match_details.append(f"Different location ({pilot_location} vs {mission_location})")
+        if matched_skills:
+            match_details.append(f"Has skills: {', '.join(csv_items(mission_skills, matched_skills))}")
+        if missing_skills:
+            missing_items.append(f"Missing skills: {', '.join(csv_items(mission_skills, missing_skills))}")
+    
+    # Check certifications
+    mission_certs = mission.get('required_certs', '')
+    pilot_certs = csv_mask(pilot.get('certifications', ''))
+    matched_certs = required_certs & pilot_certs
+    missing_certs = required_certs & ~pilot_certs
+    
+    if required_certs:
+        cert_match_rate = matched_certs.bit_count() / required_certs.bit_count()
+        score += cert_match_rate * 40  # Certifications worth 40 points
         
-        # Only suggest if pilot meets minimum requirements (has all skills and certs)
-        if not missing_skills and not missing_certs:
-            suggestions.append({
-                'pilot': pilot,
-                'score': score,
-                'match_details': match_details,
-                'missing_items': missing_items,
-                'qualification': 'Fully Qualified'
-            })
-        elif score >= 40:  # At least 50% match
-            suggestions.append({
-                'pilot': pilot,
-                'score': score,
-                'match_details': match_details,
-                'missing_items': missing_items,
-                'qualification': 'Partially Qualified'
-            })
-    
-    # Sort by score (descending) and return top N
-    suggestions.sort(key=lambda x: x['score'], reverse=True)
-    return suggestions[:top_n]
+        if matched_certs:
+            match_details.append(f"Has certs: {', '.join(csv_items(mission_certs, matched_certs))}")
+        if missing_certs:
+            missing_items.append(f"Missing certs: {', '.join(csv_items(mission_certs, missing_certs))}")
+    
+    # Check location
+    pilot_location = pilot.get('location', '').strip()
+    if pilot_location and mission_location:
+        if pilot_location.casefold() == mission_location.casefold():
+            score += 20  # Location match worth 20 points
+            match_details.append(f"Same location ({pilot_location})")
+        else:
+            match_details.append(f"Different location ({pilot_location} vs {mission_location})")
+    
+    return {
+        'pilot': pilot,
+        'score': score,
+        'match_details': match_details,
+        'missing_items': missing_items,
+        'qualification': 'Fully Qualified' if not missing_skills and not missing_certs else 'Partially Qualified'
+    }
+
+
+def _as_frame(records: Union[List[Dict], pd.DataFrame], columns: Tuple[str, ...]) -> pd.DataFrame:
+    """
+    DataFrame view of the records with every scored column present as text.
+    """
+    df = records if isinstance(records, pd.DataFrame) else pd.DataFrame.from_records(records)
+    df = df.reindex(columns=list(columns))
+    return df.astype(object).fillna('')
+
+
+def _unassigned_mask(assignment: pd.Series) -> pd.Series:
+    """
+    Vectorised agent.rules.is_unassigned over a text column (NA already '').
+    """
+    text = assignment.astype(str).str.strip()
+    return (text.str.len() <= UNASSIGNED_MAX_LEN) | text.str.casefold().isin(UNASSIGNED)
+
+
+def _record(records: Union[List[Dict], pd.DataFrame], position: int) -> Dict:
+    """
+    The caller's record at a row position (the original dict for list input).
+    """
+    if isinstance(records, pd.DataFrame):
+        return records.iloc[position].to_dict()
+    return records[position]
 
 
 def suggest_alternative_drones(
@@ -139,9 +206,17 @@ def suggest_alternative_drones(
     suggestions = []
     
     mission_location = mission.get('location', '').strip()
-    mission_start = mission.get('start_date', '')
+    mission_key = mission_location.casefold()
     mission_end = mission.get('end_date', '')
     
+    # Parse the mission end once, not per drone
+    end_date = None
+    if mission_end:
+        try:
+            end_date = parse_ddmmyyyy(mission_end)
+        except (ValueError, AttributeError):
+            pass
+    
     for drone in all_drones:
         # Skip the current drone if provided
         if current_drone and drone.get('drone_id') == current_drone.get('drone_id'):
@@ -152,8 +227,7 @@ def suggest_alternative_drones(
             continue
         
         # Check if not already assigned
-        current_assignment = drone.get('current_assignment', '')
-        if current_assignment and current_assignment not in ['–', '-', 'None', '', 'none']:
+        if not is_unassigned(drone.get('current_assignment')):
             continue
         
         # Calculate match score
@@ -163,7 +237,7 @@ def suggest_alternative_drones(
         # Check location
         drone_location = drone.get('location', '').strip()
         if drone_location and mission_location:
-            if drone_location.lower() == mission_location.lower():
+            if drone_location.casefold() == mission_key:
                 score += 30  # Location match worth 30 points
                 match_details.append(f"Same location ({drone_location})")
             else:
@@ -172,11 +246,9 @@ def suggest_alternative_drones(
         
         # Check maintenance schedule
         maintenance_due = drone.get('maintenance_due', '')
-        if maintenance_due and mission_end:
-            from datetime import datetime
+        if maintenance_due and end_date is not None:
             try:
-                maint_date = datetime.strptime(maintenance_due, '%d-%m-%Y')
-                end_date = datetime.strptime(mission_end, '%d-%m-%Y')
+                maint_date = parse_ddmmyyyy(maintenance_due)
                 
                 if maint_date > end_date:
                     score += 20  # No maintenance conflict worth 20 points
@@ -193,9 +265,8 @@ def suggest_alternative_drones(
             'capabilities': drone.get('capabilities', 'N/A')
         })
     
-    # Sort by score (descending) and return top N
-    suggestions.sort(key=lambda x: x['score'], reverse=True)
-    return suggestions[:top_n]
+    # Top N by score (descending); nlargest keeps ties in roster order like a stable sort
+    return heapq.nlargest(top_n, suggestions, key=lambda x: x['score'])
 
 
 def format_pilot_suggestions(suggestions: List[Dict]) -> str:
@@ -211,30 +282,35 @@ def format_pilot_suggestions(suggestions: List[Dict]) -> str:
     if not suggestions:
         return "No alternative pilots available that meet the requirements."
     
-    output = "💡 **Suggested Alternative Pilots:**\n\n"
+    return "💡 **Suggested Alternative Pilots:**\n\n" + ''.join(iter_pilot_suggestion_blocks(suggestions))
+
+
+def iter_pilot_suggestion_blocks(suggestions: List[Dict]) -> Iterator[str]:
+    """
+    Yield the formatted text block of each pilot suggestion in turn.
     
+    Callers that show only the first few (e.g. a quick reply) can stop
+    early without formatting the rest.
+    """
     for i, suggestion in enumerate(suggestions, 1):
         pilot = suggestion['pilot']
-        score = suggestion['score']
-        qualification = suggestion['qualification']
         match_details = suggestion['match_details']
         missing_items = suggestion['missing_items']
         
-        output += f"**{i}. {pilot.get('name')} ({pilot.get('pilot_id')})**\n"
-        output += f"   - Qualification: {qualification} (Match Score: {score:.0f}/100)\n"
-        output += f"   - Location: {pilot.get('location')}\n"
-        output += f"   - Skills: {pilot.get('skills')}\n"
-        output += f"   - Certifications: {pilot.get('certifications')}\n"
-        
+        parts = [
+            f"**{i}. {pilot.get('name')} ({pilot.get('pilot_id')})**\n",
+            f"   - Qualification: {suggestion['qualification']} (Match Score: {suggestion['score']:.0f}/100)\n",
+            f"   - Location: {pilot.get('location')}\n",
+            f"   - Skills: {pilot.get('skills')}\n",
+            f"   - Certifications: {pilot.get('certifications')}\n"
+        ]
         if match_details:
-            output += f"   - ✅ {', '.join(match_details)}\n"
-        
+            parts.append(f"   - ✅ {', '.join(match_details)}\n")
         if missing_items:
-            output += f"   - ⚠️ {', '.join(missing_items)}\n"
+            parts.append(f"   - ⚠️ {', '.join(missing_items)}\n")
+        parts.append("\n")
         
-        output += "\n"
-    
-    return output
+        yield ''.join(parts)
 
 
 def format_drone_suggestions(suggestions: List[Dict]) -> str:
@@ -250,17 +326,20 @@ def format_drone_suggestions(suggestions: List[Dict]) -> str:
     if not suggestions:
         return "No alternative drones available."
     
-    output = "💡 **Suggested Alternative Drones:**\n\n"
-    
+    return "💡 **Suggested Alternative Drones:**\n\n" + ''.join(iter_drone_suggestion_blocks(suggestions))
+
+
+def iter_drone_suggestion_blocks(suggestions: List[Dict]) -> Iterator[str]:
+    """
+    Yield the formatted text block of each drone suggestion in turn.
+    """
     for i, suggestion in enumerate(suggestions, 1):
         drone = suggestion['drone']
-        score = suggestion['score']
-        match_details = suggestion['match_details']
         
-        output += f"**{i}. {drone.get('drone_id')} ({drone.get('model')})**\n"
-        output += f"   - Match Score: {score:.0f}/100\n"
-        output += f"   - Location: {drone.get('location')}\n"
-        output += f"   - Capabilities: {suggestion.get('capabilities')}\n"
-        output += f"   - ✅ {', '.join(match_details)}\n\n"
-    
-    return output
+        yield (
+            f"**{i}. {drone.get('drone_id')} ({drone.get('model')})**\n"
+            f"   - Match Score: {suggestion['score']:.0f}/100\n"
+            f"   - Location: {drone.get('location')}\n"
+            f"   - Capabilities: {suggestion.get('capabilities')}\n"
+            f"   - ✅ {', '.join(suggestion['match_details'])}\n\n"
+        )
@@ -4,12 +4,9 @@ Beautiful home page with statistics, features, and navigation
 """
 
 import streamlit as st
-from tools.sheets import get_sheet_data
-from dotenv import load_dotenv
-import os
-
-# Load environment variables
-load_dotenv()
+from tools.sheets import batch_get_sheet_data
+from collections import Counter
+from config import DRONE_RANGE, MISSION_RANGE, PILOT_RANGE, SPREADSHEET_ID
 
 # Page configuration
 st.set_page_config(
@@ -108,17 +105,54 @@ st.markdown('<p class="hero-subtitle">AI-Powered Drone Operations Coordinator</p
 # Live Statistics Section
 st.markdown("## 📊 Live System Statistics")
 
-try:
-    # Fetch live data from Google Sheets
-    pilots_data = get_sheet_data(os.getenv('PILOT_RANGE', 'Pilot Roster!A2:H'))
-    drones_data = get_sheet_data(os.getenv('DRONE_RANGE', 'Drone Fleet!A2:F'))
-    missions_data = get_sheet_data(os.getenv('MISSION_RANGE', 'Missions!A2:I'))
+
+def _status_counts(rows: list, default_index: int):
+    """
+    Count rows and tally their lower-cased status in one pass.
+    
+    A leading header row (ranges like 'pilot_roster!A:K') is skipped and
+    used to locate the status column; headerless ranges use default_index.
+    """
+    index = default_index
+    header = [cell.strip().lower() for cell in rows[0]] if rows else []
+    if 'status' in header:
+        index = header.index('status')
+        rows = rows[1:]
+    tally = Counter(row[index].strip().lower() for row in rows if len(row) > index)
+    return len(rows), tally
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def landing_stats(spreadsheet_id: str, ranges: tuple) -> dict:
+    """Fetch all three sheets in one batchGet and reduce them to the landing counters."""
+    pilots_data, drones_data, missions_data = batch_get_sheet_data(spreadsheet_id, list(ranges))
+    
+    total_pilots, pilot_status_counts = _status_counts(pilots_data, 5)
+    _, drone_status_counts = _status_counts(drones_data, 3)
+    active_missions, _ = _status_counts(missions_data, 0)
     
-    # Count available resources
-    available_pilots = sum(1 for p in pilots_data if len(p) > 5 and p[5].lower() == 'available')
-    available_drones = sum(1 for d in drones_data if len(d) > 2 and d[2].lower() == 'available')
-    active_missions = len(missions_data)
-    total_pilots = len(pilots_data)
+    return {
+        'total_pilots': total_pilots,
+        'available_pilots': pilot_status_counts.get('available', 0),
+        'available_drones': drone_status_counts.get('available', 0),
+        'active_missions': active_missions
+    }
+
+
+try:
+    # Fetch live data from Google Sheets (one round-trip for all three)
+    stats = landing_stats(
+        SPREADSHEET_ID,
+        (
+            PILOT_RANGE or 'Pilot Roster!A2:H',
+            DRONE_RANGE or 'Drone Fleet!A2:F',
+            MISSION_RANGE or 'Missions!A2:I'
+        )
+    )
+    total_pilots = stats['total_pilots']
+    available_pilots = stats['available_pilots']
+    available_drones = stats['available_drones']
+    active_missions = stats['active_missions']
     
     # Display stats in columns
     col1, col2, col3, col4 = st.columns(4)
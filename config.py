@@ -0,0 +1,27 @@
+# Part of SkyOps Agent system – see README for architecture
+
+"""
+Environment settings, loaded from .env once per process.
+
+Streamlit re-executes page scripts on every rerun, but imported modules are
+cached, so reading the settings here keeps load_dotenv() and the getenv
+lookups off the rerun path.
+"""
+
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Google Sheets
+SPREADSHEET_ID = os.getenv('SPREADSHEET_ID')
+
+# Sheet ranges used by the Streamlit pages
+PILOT_RANGE = os.getenv('PILOT_RANGE')
+DRONE_RANGE = os.getenv('DRONE_RANGE')
+MISSION_RANGE = os.getenv('MISSION_RANGE')
+
+# Sheet ranges used by the agent and the add_new_* tools
+PILOTS_SHEET_RANGE = os.getenv('PILOTS_SHEET_RANGE')
+DRONES_SHEET_RANGE = os.getenv('DRONES_SHEET_RANGE')
+MISSIONS_SHEET_RANGE = os.getenv('MISSIONS_SHEET_RANGE')
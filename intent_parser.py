@@ -9,11 +9,60 @@ IMPORTANT:
 """
 
 import os
+import re
+import copy
 import json
-from typing import Dict, Optional
-from dotenv import load_dotenv
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
 
-load_dotenv()
+import config  # noqa: F401  loads .env once per process (API keys are read per call)
+
+# LLM parses keyed by (provider, query), so a repeated chat message skips
+# the API round trip. Only successful LLM parses are stored: a fallback
+# caused by a missing key or an API error is retried on the next call.
+# Oldest entries are evicted first once LLM_INTENT_CACHE_SIZE is reached;
+# updates go through a lock, since Streamlit sessions parse from several
+# threads.
+LLM_INTENT_CACHE_SIZE = 512
+
+# Intent extraction is a short JSON answer: a small model, a token cap and
+# a request timeout keep the LLM path fast (timeouts fall back to keywords)
+OPENAI_INTENT_MODEL = os.getenv('OPENAI_INTENT_MODEL', 'gpt-4o-mini')
+LLM_MAX_TOKENS = 256
+LLM_TIMEOUT = float(os.getenv('LLM_TIMEOUT', '10'))
+_llm_intent_cache: Dict[Tuple[str, str], Dict] = {}
+_llm_intent_cache_lock = threading.Lock()
+
+# Longest query_info request answered by keywords alone when use_llm is on
+KEYWORD_QUERY_MAX_WORDS = 6
+
+
+def _keywords(*words: str) -> re.Pattern:
+    """Compile keywords into one alternation that finds any of them as a substring."""
+    return re.compile('|'.join(map(re.escape, words)))
+
+
+# Keyword groups for the rule-based parser, compiled once. Matching stays
+# substring-based ('pilots' hits 'pilot', 'reassign' hits 'assign'), but each
+# group is one regex scan instead of a Python loop of `in` tests.
+_ADD_KW = _keywords('add', 'create', 'new', 'register')
+_PILOT_KW = _keywords('pilot', 'person', 'operator')
+_DRONE_KW = _keywords('drone', 'uav', 'aircraft')
+_MISSION_KW = _keywords('mission', 'project', 'job', 'task')
+_MOVE_KW = _keywords('reassign', 'move', 'transfer')
+_SWITCH_KW = _keywords('switch')
+_EMERGENCY_KW = _keywords('urgent', 'emergency')
+_ASSIGN_KW = _keywords('assign', 'allocate', 'schedule', 'book', 'give')
+_URGENT_KW = _keywords('urgent', 'emergency', 'asap', 'immediately')
+
+# Entity shapes: a word starting with 'D' that contains a digit is a drone ID
+_DRONE_ID_RE = re.compile(r'D\D*\d')
+_MISSION_PREFIXES = ('PRJ', 'Project', 'Mission')
+_NAME_CONTEXT_WORDS = frozenset({'pilot', 'assign', 'schedule'})
+_NON_NAME_WORDS = frozenset({'Mission', 'Drone', 'Project', 'Client'})
+# Words that open a question or command rather than name someone
+_QUERY_LEADS = frozenset({'list', 'show', 'display', 'view', 'get', 'find', 'what', 'which', 'who', 'how'})
 
 
 def parse_intent(query: str) -> Dict:
@@ -57,28 +106,26 @@ def _detect_action(query_lower: str) -> str:
     Detect the intent action from the query.
     """
     # Add new resource keywords
-    if any(word in query_lower for word in ['add', 'create', 'new', 'register']):
-        if any(word in query_lower for word in ['pilot', 'person', 'operator']):
+    if _ADD_KW.search(query_lower):
+        if _PILOT_KW.search(query_lower):
             return 'add_pilot'
-        elif any(word in query_lower for word in ['drone', 'uav', 'aircraft']):
+        elif _DRONE_KW.search(query_lower):
             return 'add_drone'
-        elif any(word in query_lower for word in ['mission', 'project', 'job', 'task']):
+        elif _MISSION_KW.search(query_lower):
             return 'add_mission'
     
-    # Urgent reassignment keywords
-    if any(word in query_lower for word in ['urgent', 'emergency', 'reassign', 'move', 'transfer']):
-        if any(word in query_lower for word in ['reassign', 'move', 'transfer', 'switch']):
-            return 'urgent_reassign'
+    # Urgent reassignment: a move verb on its own, or "switch" in an
+    # urgent/emergency request (one scan in the common case)
+    if _MOVE_KW.search(query_lower) or (
+        _SWITCH_KW.search(query_lower) and _EMERGENCY_KW.search(query_lower)
+    ):
+        return 'urgent_reassign'
     
     # Assignment keywords
-    if any(word in query_lower for word in ['assign', 'allocate', 'schedule', 'book', 'give']):
+    if _ASSIGN_KW.search(query_lower):
         return 'assign_mission'
     
-    # Query keywords (default)
-    if any(word in query_lower for word in ['show', 'list', 'who', 'what', 'which', 'status', 'available', 'check', 'find', 'get']):
-        return 'query_info'
-    
-    # Default to query
+    # Query keywords and anything else default to a query
     return 'query_info'
 
 
@@ -88,51 +135,54 @@ def _extract_entities(query: str) -> Dict:
     """
     entities = {}
     
-    # Extract pilot names (capitalized words that look like names)
+    # Split and lowercase once; every pass below indexes into these
     words = query.split()
+    lower_words = [w.lower() for w in words]
+    query_lower = query.lower()
+    
+    # Extract pilot names (capitalized words that look like names)
     for i, word in enumerate(words):
         if word[0].isupper() and len(word) > 2:
             # Check if it's after "pilot", "assign", or similar context
-            if i > 0 and words[i-1].lower() in ['pilot', 'assign', 'schedule']:
+            if i > 0 and lower_words[i-1] in _NAME_CONTEXT_WORDS:
                 entities['pilot_name'] = word
                 break
             # Or if it's a standalone capitalized word (likely a name)
-            elif word not in ['Mission', 'Drone', 'Project', 'Client']:
+            elif word not in _NON_NAME_WORDS:
                 entities['pilot_name'] = word
     
-    # Extract drone IDs (pattern: D followed by digits or specific formats)
+    # Extract drone IDs (pattern: D followed by digits or specific formats);
+    # failing that, the word after the first one mentioning "drone"
+    drone_after = None
+    if 'drone' in query_lower:
+        drone_idx = next(i for i, w in enumerate(lower_words) if 'drone' in w)
+        if drone_idx + 1 < len(words):
+            drone_after = words[drone_idx + 1]
     for word in words:
-        if word.startswith('D') and any(c.isdigit() for c in word):
+        if _DRONE_ID_RE.match(word):
             entities['drone_id'] = word
             break
-        elif 'drone' in query.lower():
-            # Try to find the next word after "drone"
-            drone_idx = [i for i, w in enumerate(words) if 'drone' in w.lower()]
-            if drone_idx and drone_idx[0] + 1 < len(words):
-                entities['drone_id'] = words[drone_idx[0] + 1]
-                break
+        elif drone_after is not None:
+            entities['drone_id'] = drone_after
+            break
     
-    # Extract mission/project IDs (pattern: PRJ or Project followed by identifier)
+    # Extract mission/project IDs (pattern: PRJ, Project or Mission prefix)
     for word in words:
-        if word.startswith('PRJ') or word.startswith('Project'):
-            entities['mission_id'] = word
-            break
-        elif word.startswith('Mission'):
+        if word.startswith(_MISSION_PREFIXES):
             entities['mission_id'] = word
             break
     
     # Extract "from" and "to" missions for reassignment
-    if 'from' in query.lower() and 'to' in query.lower():
-        from_idx = [i for i, w in enumerate(words) if w.lower() == 'from']
-        to_idx = [i for i, w in enumerate(words) if w.lower() == 'to']
-        
-        if from_idx and to_idx:
+    if 'from' in query_lower and 'to' in query_lower:
+        if 'from' in lower_words and 'to' in lower_words:
             # Get mission after "from"
-            if from_idx[0] + 1 < len(words):
-                entities['from_mission_id'] = words[from_idx[0] + 1]
+            from_idx = lower_words.index('from')
+            if from_idx + 1 < len(words):
+                entities['from_mission_id'] = words[from_idx + 1]
             # Get mission after "to"
-            if to_idx[0] + 1 < len(words):
-                entities['to_mission_id'] = words[to_idx[0] + 1]
+            to_idx = lower_words.index('to')
+            if to_idx + 1 < len(words):
+                entities['to_mission_id'] = words[to_idx + 1]
     
     return entities
 
@@ -154,10 +204,7 @@ def _extract_parameters(query_lower: str) -> Dict:
         parameters['query_type'] = 'summary'
     
     # Check for urgent flag
-    if any(word in query_lower for word in ['urgent', 'emergency', 'asap', 'immediately']):
-        parameters['urgent'] = True
-    else:
-        parameters['urgent'] = False
+    parameters['urgent'] = _URGENT_KW.search(query_lower) is not None
     
     return parameters
 
@@ -201,6 +248,16 @@ Examples:
 
 Return ONLY valid JSON, no explanations."""
 
+    # Clear-cut requests are answered by the keyword parser without a round trip
+    keyword_intent = _confident_keyword_intent(query)
+    if keyword_intent is not None:
+        return keyword_intent
+    
+    cached = _llm_intent_cache.get((api_provider, query))
+    if cached is not None:
+        # Callers may mutate the intent, so hand out a copy
+        return copy.deepcopy(cached)
+    
     if api_provider == 'openai':
         return _parse_with_openai(query, system_prompt)
     elif api_provider == 'anthropic':
@@ -210,32 +267,131 @@ Return ONLY valid JSON, no explanations."""
         return parse_intent(query)
 
 
+def _confident_keyword_intent(query: str) -> Optional[Dict]:
+    """
+    The keyword parse of the query, if it already holds everything the
+    planner needs; None when the query should go to the LLM.
+    
+    Add requests are never sent to the LLM (its prompt does not cover
+    them); assignments and reassignments need all their entities, and any
+    pilot name must be a trusted one (see _is_context_name); queries must
+    be short, name a resource type and mention no specific entity.
+    A capitalised leading verb ("Show ...") is not taken as a pilot name.
+    
+    Args:
+        query: User query
+    
+    Returns:
+        Structured intent dictionary, or None
+    """
+    intent = parse_intent(query)
+    action = intent['action']
+    entities = intent['entities']
+    
+    if action.startswith('add_'):
+        return intent
+    if action == 'assign_mission':
+        complete = (
+            all(entities.get(key) for key in ('pilot_name', 'drone_id', 'mission_id'))
+            and _is_context_name(query, entities)
+        )
+        return intent if complete else None
+    if action == 'urgent_reassign':
+        complete = (
+            entities.get('from_mission_id') and entities.get('to_mission_id')
+            and (entities.get('drone_id') or entities.get('pilot_name'))
+            and (not entities.get('pilot_name') or _is_context_name(query, entities))
+        )
+        return intent if complete else None
+    
+    words = query.split()
+    if len(words) > KEYWORD_QUERY_MAX_WORDS or intent['parameters'].get('query_type') == 'summary':
+        return None
+    if entities.keys() == {'pilot_name'} and entities['pilot_name'] == words[0] and words[0].lower() in _QUERY_LEADS:
+        entities.clear()
+    return None if entities else intent
+
+
+def _is_context_name(query: str, entities: Dict) -> bool:
+    """
+    Whether the extracted pilot name can be trusted without the LLM.
+    
+    The keyword extractor falls back to the last capitalised word, which
+    may be an ID or a filler word ('ASAP'); only a name that directly
+    follows a _NAME_CONTEXT_WORDS word ("assign Arjun", "pilot Arjun") and
+    is none of the extracted IDs counts.
+    """
+    name = entities.get('pilot_name')
+    ids = {value for key, value in entities.items() if key != 'pilot_name'}
+    if not name or name in ids:
+        return False
+    
+    words = query.split()
+    return any(
+        word == name and words[i - 1].lower() in _NAME_CONTEXT_WORDS
+        for i, word in enumerate(words) if i > 0
+    )
+
+
+def _remember_llm_intent(api_provider: str, query: str, intent: Dict) -> None:
+    """
+    Store a copy of a successful LLM parse in _llm_intent_cache.
+    """
+    key = (api_provider, query)
+    stored = copy.deepcopy(intent)
+    with _llm_intent_cache_lock:
+        if key not in _llm_intent_cache and len(_llm_intent_cache) >= LLM_INTENT_CACHE_SIZE:
+            _llm_intent_cache.pop(next(iter(_llm_intent_cache)), None)
+        _llm_intent_cache[key] = stored
+
+
+@lru_cache(maxsize=2)
+def _openai_client(api_key: str):
+    """
+    OpenAI client per API key, reused so its HTTP connection pool stays warm.
+    """
+    import openai
+    
+    return openai.OpenAI(api_key=api_key)
+
+
+@lru_cache(maxsize=2)
+def _anthropic_client(api_key: str):
+    """
+    Anthropic client per API key, reused so its HTTP connection pool stays warm.
+    """
+    import anthropic
+    
+    return anthropic.Anthropic(api_key=api_key)
+
+
 def _parse_with_openai(query: str, system_prompt: str) -> Dict:
     """
     Parse intent using OpenAI API.
     """
     try:
-        import openai
-        
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
             print("Warning: OPENAI_API_KEY not set, using simple parser")
             return parse_intent(query)
         
-        client = openai.OpenAI(api_key=api_key)
+        client = _openai_client(api_key)
         
         response = client.chat.completions.create(
-            model="gpt-4",
+            model=OPENAI_INTENT_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": query}
             ],
             temperature=0,
-            response_format={"type": "json_object"}
+            max_tokens=LLM_MAX_TOKENS,
+            response_format={"type": "json_object"},
+            timeout=LLM_TIMEOUT
         )
         
         intent = json.loads(response.choices[0].message.content)
         intent['original_query'] = query
+        _remember_llm_intent('openai', query, intent)
         return intent
         
     except Exception as e:
@@ -243,31 +399,59 @@ def _parse_with_openai(query: str, system_prompt: str) -> Dict:
         return parse_intent(query)
 
 
+def _first_json_object(chunks: Iterable[str]) -> Dict:
+    """
+    Read streamed text until it holds one complete JSON object and return it.
+    
+    Text before the opening brace is skipped and nothing after the closing
+    brace is read, so the caller can close the stream early.
+    
+    Raises:
+        ValueError: If the stream ends without a complete JSON object
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    for chunk in chunks:
+        buffer += chunk
+        start = buffer.find('{')
+        if start == -1 or '}' not in chunk:
+            continue
+        try:
+            intent, _ = decoder.raw_decode(buffer, start)
+        except json.JSONDecodeError:
+            continue
+        return intent
+    # Let json report what is wrong with the full text
+    return json.loads(buffer)
+
+
 def _parse_with_anthropic(query: str, system_prompt: str) -> Dict:
     """
     Parse intent using Anthropic API.
     """
     try:
-        import anthropic
-        
         api_key = os.getenv('ANTHROPIC_API_KEY')
         if not api_key:
             print("Warning: ANTHROPIC_API_KEY not set, using simple parser")
             return parse_intent(query)
         
-        client = anthropic.Anthropic(api_key=api_key)
+        client = _anthropic_client(api_key)
         
-        message = client.messages.create(
+        # Streamed so the call can stop as soon as the JSON object is
+        # complete, instead of waiting for any trailing prose
+        with client.messages.stream(
             model="claude-3-5-sonnet-20241022",
             max_tokens=1024,
             system=system_prompt,
             messages=[
                 {"role": "user", "content": query}
-            ]
-        )
+            ],
+            timeout=LLM_TIMEOUT
+        ) as stream:
+            intent = _first_json_object(stream.text_stream)
         
-        intent = json.loads(message.content[0].text)
         intent['original_query'] = query
+        _remember_llm_intent('anthropic', query, intent)
         return intent
         
     except Exception as e:
@@ -4,10 +4,16 @@
 Chat Interface - Interact with SkyOps Agent
 """
 
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 import streamlit as st
 import pandas as pd
-from agent.coordinator import run_agent
-from agent.memory import agent_state
+from agent.coordinator import read_summary_counts, run_agent
+from config import DRONE_RANGE, MISSION_RANGE, PILOT_RANGE, SPREADSHEET_ID
+from tools.sheets import batch_get_sheets_as_df
+
+# Messages replayed on each rerun; older ones are shown on request
+CHAT_HISTORY_WINDOW = 50
 
 # Page configuration
 st.set_page_config(
@@ -39,48 +45,71 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Header
-st.markdown('<div class="main-header">🚁 SkyOps Agent</div>', unsafe_allow_html=True)
-st.markdown('<div class="sub-header">Intelligent Drone Operations Coordinator</div>', unsafe_allow_html=True)
 
-# Sidebar
-with st.sidebar:
-    st.header("⚙️ Configuration")
+@st.cache_data(ttl=30, show_spinner=False)
+def load_quick_stats(spreadsheet_id: str, pilot_range: str, drone_range: str, mission_range: str) -> dict:
+    """
+    Sidebar counters, cached so chat reruns do not re-read the sheets.
     
-    use_llm = st.checkbox(
-        "Use LLM for Intent Parsing",
-        value=False,
-        help="Enable to use OpenAI/Anthropic for better intent understanding. Disable for simple keyword-based parsing."
-    )
+    Only the ID and status columns of each sheet are fetched, through the
+    agent's summary-count helper. Sheets those columns cannot be found in
+    fall back to a whole-sheet read, batched together.
+    """
+    full_ranges = {'pilots': pilot_range, 'drones': drone_range, 'missions': mission_range}
+    summary = read_summary_counts(spreadsheet_id, full_ranges)
     
-    st.divider()
+    mismatched = [full_ranges[sheet] for sheet, sheet_counts in summary.items() if sheet_counts is None]
+    frames = batch_get_sheets_as_df(spreadsheet_id, mismatched) if mismatched else {}
     
-    st.header("📊 Quick Stats")
+    counts = {}
+    for sheet, sheet_counts in summary.items():
+        if sheet_counts is None:
+            df = frames[full_ranges[sheet]]
+            status = df['status'] if 'status' in df.columns else pd.Series([], dtype=object)
+            counts[sheet] = (len(df), _count_available(status))
+        else:
+            total, tally = sheet_counts
+            counts[sheet] = (total, sum(n for value, n in tally.items() if str(value).lower() == 'available'))
+    
+    return {
+        'total_pilots': counts['pilots'][0],
+        'available_pilots': counts['pilots'][1],
+        'total_drones': counts['drones'][0],
+        'available_drones': counts['drones'][1],
+        'total_missions': counts['missions'][0]
+    }
+
+
+def _count_available(status: pd.Series) -> int:
+    """Cells equal to 'available' (any case), counted on the raw array."""
+    return int((status.astype(str).str.lower().to_numpy() == 'available').sum())
+
+
+def _fragment(run_every: int):
+    """st.fragment where available (Streamlit 1.37+); a plain function otherwise."""
+    fragment = getattr(st, 'fragment', None)
+    if fragment is None:
+        return lambda func: func
+    return fragment(run_every=run_every)
+
+
+@_fragment(run_every=60)
+def sidebar_stats():
+    """
+    Quick Stats block. As a fragment it refreshes itself every minute, and
+    its Refresh button reruns only this block rather than the whole chat page.
+    """
+    # Checked before loading so a click shows freshly read counts
+    if st.button("🔄 Refresh Stats", use_container_width=True):
+        load_quick_stats.clear()
     
-    # Load real-time data for sidebar
     try:
-        from tools.sheets import get_sheet_as_df
-        import os
-        from dotenv import load_dotenv
-        load_dotenv()
-        
-        spreadsheet_id = os.getenv('SPREADSHEET_ID')
-        pilot_range = os.getenv('PILOT_RANGE')
-        drone_range = os.getenv('DRONE_RANGE')
-        mission_range = os.getenv('MISSION_RANGE')
-        
-        pilots_df = get_sheet_as_df(spreadsheet_id, pilot_range)
-        drones_df = get_sheet_as_df(spreadsheet_id, drone_range)
-        missions_df = get_sheet_as_df(spreadsheet_id, mission_range)
-        
-        # Calculate stats
-        total_pilots = len(pilots_df)
-        available_pilots = len(pilots_df[pilots_df['status'].str.lower() == 'available']) if 'status' in pilots_df.columns else 0
-        
-        total_drones = len(drones_df)
-        available_drones = len(drones_df[drones_df['status'].str.lower() == 'available']) if 'status' in drones_df.columns else 0
-        
-        total_missions = len(missions_df)
+        stats = load_quick_stats(SPREADSHEET_ID, PILOT_RANGE, DRONE_RANGE, MISSION_RANGE)
+        total_pilots = stats['total_pilots']
+        available_pilots = stats['available_pilots']
+        total_drones = stats['total_drones']
+        available_drones = stats['available_drones']
+        total_missions = stats['total_missions']
         
         # Display metrics
         col1, col2 = st.columns(2)
@@ -101,6 +130,51 @@ with st.sidebar:
             
     except Exception as e:
         st.info("Unable to load live stats")
+
+
+@dataclass(slots=True)
+class ChatMessage:
+    """
+    One entry of the chat history; slotted, as long sessions keep every one.
+    """
+    role: str
+    content: str
+    data: Optional[Dict] = None
+    frames: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+
+def message_frame(message: ChatMessage, key: str) -> pd.DataFrame:
+    """
+    DataFrame for one table in a chat message, built once and kept on it.
+    
+    Streamlit reruns the page on every submission and replays the whole
+    history, so frames are reused instead of rebuilt from the records.
+    """
+    frames = message.frames
+    if key not in frames:
+        frames[key] = pd.DataFrame(message.data[key])
+    return frames[key]
+
+
+# Header
+st.markdown('<div class="main-header">🚁 SkyOps Agent</div>', unsafe_allow_html=True)
+st.markdown('<div class="sub-header">Intelligent Drone Operations Coordinator</div>', unsafe_allow_html=True)
+
+# Sidebar
+with st.sidebar:
+    st.header("⚙️ Configuration")
+    
+    use_llm = st.checkbox(
+        "Use LLM for Intent Parsing",
+        value=False,
+        help="Enable to use OpenAI/Anthropic for better intent understanding. Disable for simple keyword-based parsing."
+    )
+    
+    st.divider()
+    
+    st.header("📊 Quick Stats")
+    
+    sidebar_stats()
     
     st.divider()
     
@@ -122,35 +196,43 @@ with st.sidebar:
     
     if st.button("🔄 Clear Chat History", use_container_width=True):
         st.session_state.messages = []
+        st.session_state.pop('history_window', None)
         st.rerun()
 
 # Initialize chat history
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-# Display chat messages
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
-        st.markdown(message["content"])
+# Display chat messages (the most recent window of the history)
+history_window = st.session_state.get('history_window', CHAT_HISTORY_WINDOW)
+hidden_messages = len(st.session_state.messages) - history_window
+if hidden_messages > 0:
+    if st.button(f"⬆️ Load older messages ({hidden_messages} hidden)"):
+        st.session_state.history_window = history_window + CHAT_HISTORY_WINDOW
+        st.rerun()
+
+for message in st.session_state.messages[-history_window:]:
+    with st.chat_message(message.role):
+        st.markdown(message.content)
         
         # Display data if present
-        if "data" in message and message["data"]:
-            data = message["data"]
+        if message.data:
+            data = message.data
             
             # Display pilots
             if "pilots" in data and data["pilots"]:
                 with st.expander("📋 Pilot Details"):
-                    st.dataframe(pd.DataFrame(data["pilots"]), use_container_width=True)
+                    st.dataframe(message_frame(message, "pilots"), use_container_width=True)
             
             # Display drones
             if "drones" in data and data["drones"]:
                 with st.expander("🚁 Drone Details"):
-                    st.dataframe(pd.DataFrame(data["drones"]), use_container_width=True)
+                    st.dataframe(message_frame(message, "drones"), use_container_width=True)
             
             # Display missions
             if "missions" in data and data["missions"]:
                 with st.expander("📦 Mission Details"):
-                    st.dataframe(pd.DataFrame(data["missions"]), use_container_width=True)
+                    st.dataframe(message_frame(message, "missions"), use_container_width=True)
             
             # Display validation warnings
             if "warnings" in data and data["warnings"]:
@@ -161,7 +243,7 @@ for message in st.session_state.messages:
 # Chat input
 if prompt := st.chat_input("What would you like to do?"):
     # Add user message to chat history
-    st.session_state.messages.append({"role": "user", "content": prompt})
+    st.session_state.messages.append(ChatMessage(role="user", content=prompt))
     
     # Display user message
     with st.chat_message("user"):
@@ -172,6 +254,9 @@ if prompt := st.chat_input("What would you like to do?"):
         with st.spinner("Processing..."):
             # Run the agent
             result = run_agent(prompt, use_llm=use_llm)
+            if result['success'] and result.get('action') != 'query_info':
+                # Assignments and additions change the counts shown in the sidebar
+                load_quick_stats.clear()
             
             # Display the response
             if result['success']:
@@ -180,29 +265,27 @@ if prompt := st.chat_input("What would you like to do?"):
                 st.error(result['message'])
             
             # Store assistant message
-            assistant_message = {
-                "role": "assistant",
-                "content": result['message']
-            }
+            assistant_message = ChatMessage(
+                role="assistant",
+                content=result['message'],
+                data=result.get('data') or None
+            )
             
-            # Add data if present
-            if result.get('data'):
-                assistant_message["data"] = result['data']
-                
-                # Display data immediately
-                data = result['data']
+            # Display data immediately if present
+            if assistant_message.data:
+                data = assistant_message.data
                 
                 if "pilots" in data and data["pilots"]:
                     with st.expander("📋 Pilot Details", expanded=True):
-                        st.dataframe(pd.DataFrame(data["pilots"]), use_container_width=True)
+                        st.dataframe(message_frame(assistant_message, "pilots"), use_container_width=True)
                 
                 if "drones" in data and data["drones"]:
                     with st.expander("🚁 Drone Details", expanded=True):
-                        st.dataframe(pd.DataFrame(data["drones"]), use_container_width=True)
+                        st.dataframe(message_frame(assistant_message, "drones"), use_container_width=True)
                 
                 if "missions" in data and data["missions"]:
                     with st.expander("📦 Mission Details", expanded=True):
-                        st.dataframe(pd.DataFrame(data["missions"]), use_container_width=True)
+                        st.dataframe(message_frame(assistant_message, "missions"), use_container_width=True)
                 
                 if "warnings" in data and data["warnings"]:
                     with st.expander("⚠️ Warnings"):
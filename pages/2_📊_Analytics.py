@@ -6,11 +6,9 @@ Data View page - Statistics and Analytics Dashboard
 
 import streamlit as st
 import pandas as pd
-from tools.sheets import get_sheet_as_df
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from tools.sheets import invalidate_sheet_cache
+from tools.sheets_cache import clear_sheets, load_sheets
+from config import DRONE_RANGE, MISSION_RANGE, PILOT_RANGE, SPREADSHEET_ID
 
 st.set_page_config(
     page_title="Analytics - SkyOps Agent",
@@ -55,26 +53,69 @@ st.markdown("""
 st.markdown('<div style="text-align: center;"><h1>📊 Operations Analytics</h1></div>', unsafe_allow_html=True)
 st.markdown('<div style="text-align: center; color: #666; margin-bottom: 2rem;">Real-time insights into drone operations</div>', unsafe_allow_html=True)
 
-# Add refresh button
+# Add refresh button: drop only this data's caches (the page cache and the
+# tools.sheets read cache), not every cached function in the app
 if st.button("🔄 Refresh Data"):
-    st.cache_data.clear()
+    clear_sheets()
+    invalidate_sheet_cache(SPREADSHEET_ID)
     st.rerun()
 
 st.divider()
 
-# Load data with caching
-@st.cache_data(ttl=60)
+
+def _count_status(status: pd.Series, value: str) -> int:
+    """
+    Rows of a categorical column (status, priority) equal to value in any case.
+    
+    Only the few category labels are lowercased; rows are matched on
+    their integer codes.
+    """
+    codes = [code for code, label in enumerate(status.cat.categories) if str(label).lower() == value]
+    return int(status.cat.codes.isin(codes).sum())
+
+
+def _breakdown_markdown(counts: pd.Series, total: int, icons: dict, default_icon: str, decimals: int = 1) -> str:
+    """
+    One markdown list of "icon label: count (pct%)" lines for value counts.
+    
+    Rendered with a single st.markdown call rather than one alert element
+    per value; icons are keyed by the lowercased label.
+    """
+    if counts.empty:
+        return ""
+    labels = pd.Series(counts.index.astype(str), index=counts.index)
+    icon = labels.str.lower().map(icons).fillna(default_icon)
+    percent = (counts / total * 100).map(lambda value: f"{value:.{decimals}f}")
+    lines = "- " + icon + " **" + labels + "**: " + counts.astype(str) + " (" + percent + "%)"
+    return "\n".join(lines)
+
+
+def _location_frame(counts: pd.Series, total: int, label: str) -> pd.DataFrame:
+    """Location value counts as one table (count and share of total) for st.dataframe."""
+    return pd.DataFrame({
+        'Location': counts.index.astype(str),
+        label: counts.to_numpy(),
+        'Share': counts.to_numpy() / total * 100
+    })
+
+
+def _assigned_by_mission(df: pd.DataFrame, column: str, mission_ids: pd.Series) -> pd.Series:
+    """
+    For each mission, `column` of the first row assigned to it (NaN if none).
+    
+    One hash lookup per mission instead of a scan of the roster per mission.
+    """
+    if 'current_assignment' not in df.columns or column not in df.columns:
+        return pd.Series(index=mission_ids.index, dtype=object)
+    lookup = df.drop_duplicates('current_assignment').set_index('current_assignment')[column]
+    return mission_ids.map(lookup)
+
+
+# Load data (cached in tools.sheets_cache, shared with the Add Resources page)
 def load_all_data():
     """Load all data from Google Sheets with caching."""
     try:
-        spreadsheet_id = os.getenv('SPREADSHEET_ID')
-        pilot_range = os.getenv('PILOT_RANGE')
-        drone_range = os.getenv('DRONE_RANGE')
-        mission_range = os.getenv('MISSION_RANGE')
-        
-        pilots_df = get_sheet_as_df(spreadsheet_id, pilot_range)
-        drones_df = get_sheet_as_df(spreadsheet_id, drone_range)
-        missions_df = get_sheet_as_df(spreadsheet_id, mission_range)
+        pilots_df, drones_df, missions_df = load_sheets(SPREADSHEET_ID, PILOT_RANGE, DRONE_RANGE, MISSION_RANGE)
         return pilots_df, drones_df, missions_df, None
     except Exception as e:
         return None, None, None, str(e)
@@ -94,7 +135,7 @@ col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     total_pilots = len(pilots_df)
-    available_pilots = len(pilots_df[pilots_df['status'].str.lower() == 'available'])
+    available_pilots = _count_status(pilots_df['status'], 'available')
     st.markdown(f"""
     <div class="stat-card">
         <div class="big-number">{total_pilots}</div>
@@ -112,7 +153,7 @@ with col2:
 
 with col3:
     total_drones = len(drones_df)
-    available_drones = len(drones_df[drones_df['status'].str.lower() == 'available'])
+    available_drones = _count_status(drones_df['status'], 'available')
     st.markdown(f"""
     <div class="stat-card">
         <div class="big-number">{total_drones}</div>
@@ -148,15 +189,9 @@ with col1:
         st.bar_chart(chart_data.set_index('Status'))
         
         # Show percentages
-        st.markdown("**Breakdown:**")
-        for status, count in status_counts.items():
-            percentage = (count / len(pilots_df)) * 100
-            if status.lower() == 'available':
-                st.success(f"✅ {status}: {count} ({percentage:.1f}%)")
-            elif status.lower() == 'assigned':
-                st.info(f"📌 {status}: {count} ({percentage:.1f}%)")
-            else:
-                st.warning(f"⚠️ {status}: {count} ({percentage:.1f}%)")
+        st.markdown("**Breakdown:**\n\n" + _breakdown_markdown(
+            status_counts, total_pilots, {'available': '✅', 'assigned': '📌'}, '⚠️'
+        ))
 
 with col2:
     st.markdown("### 🚁 Drone Status Distribution")
@@ -173,15 +208,9 @@ with col2:
         st.bar_chart(chart_data_drone.set_index('Status'))
         
         # Show percentages
-        st.markdown("**Breakdown:**")
-        for status, count in drone_status_counts.items():
-            percentage = (count / len(drones_df)) * 100
-            if status.lower() == 'available':
-                st.success(f"✅ {status}: {count} ({percentage:.1f}%)")
-            elif status.lower() == 'assigned':
-                st.info(f"📌 {status}: {count} ({percentage:.1f}%)")
-            else:
-                st.error(f"🔧 {status}: {count} ({percentage:.1f}%)")
+        st.markdown("**Breakdown:**\n\n" + _breakdown_markdown(
+            drone_status_counts, total_drones, {'available': '✅', 'assigned': '📌'}, '🔧'
+        ))
 
 st.divider()
 
@@ -193,26 +222,40 @@ with col1:
     
     if 'location' in pilots_df.columns:
         location_counts = pilots_df['location'].value_counts()
-        
-        for location, count in location_counts.items():
-            percentage = (count / len(pilots_df)) * 100
-            st.metric(location, f"{count} pilots", f"{percentage:.0f}% of total")
+        st.dataframe(
+            _location_frame(location_counts, total_pilots, 'Pilots'),
+            hide_index=True,
+            use_container_width=True,
+            column_config={'Share': st.column_config.NumberColumn(format="%.0f%%")}
+        )
 
 with col2:
     st.markdown("### 📍 Drones by Location")
     
     if 'location' in drones_df.columns:
         drone_location_counts = drones_df['location'].value_counts()
-        
-        for location, count in drone_location_counts.items():
-            percentage = (count / len(drones_df)) * 100
-            st.metric(location, f"{count} drones", f"{percentage:.0f}% of total")
+        st.dataframe(
+            _location_frame(drone_location_counts, total_drones, 'Drones'),
+            hide_index=True,
+            use_container_width=True,
+            column_config={'Share': st.column_config.NumberColumn(format="%.0f%%")}
+        )
 
 st.divider()
 
 # === MISSION ANALYTICS ===
 st.markdown("### 📦 Mission Analytics")
 
+# Assigned pilot and drone per mission, shared by the KPIs and the matrix below
+if 'project_id' in missions_df.columns:
+    mission_ids = missions_df['project_id']
+else:
+    mission_ids = pd.Series('N/A', index=missions_df.index, dtype=object)
+mission_pilots = _assigned_by_mission(pilots_df, 'name', mission_ids)
+mission_drones = _assigned_by_mission(drones_df, 'drone_id', mission_ids)
+has_pilot = mission_pilots.notna()
+has_drone = mission_drones.notna()
+
 col1, col2, col3 = st.columns(3)
 
 with col1:
@@ -226,13 +269,7 @@ with col1:
 
 with col2:
     # Calculate fully assigned missions
-    assigned_missions = 0
-    for _, mission in missions_df.iterrows():
-        mission_id = mission.get('project_id', '')
-        has_pilot = any(pilots_df.get('current_assignment', '') == mission_id)
-        has_drone = any(drones_df.get('current_assignment', '') == mission_id)
-        if has_pilot and has_drone:
-            assigned_missions += 1
+    assigned_missions = int((has_pilot & has_drone).sum())
     
     assignment_rate = (assigned_missions / total_missions * 100) if total_missions > 0 else 0
     st.markdown(f"""
@@ -244,7 +281,7 @@ with col2:
 
 with col3:
     if 'priority' in missions_df.columns:
-        urgent_missions = len(missions_df[missions_df['priority'].str.lower() == 'urgent'])
+        urgent_missions = _count_status(missions_df['priority'], 'urgent')
         st.markdown(f"""
         <div class="stat-card stat-card-orange">
             <div class="big-number">{urgent_missions}</div>
@@ -257,16 +294,9 @@ if 'priority' in missions_df.columns:
     st.markdown("#### Mission Priority Distribution")
     priority_counts = missions_df['priority'].value_counts()
     
-    col1, col2, col3 = st.columns(3)
-    for i, (priority, count) in enumerate(priority_counts.items()):
-        percentage = (count / len(missions_df)) * 100
-        with [col1, col2, col3][i % 3]:
-            if priority.lower() == 'urgent':
-                st.error(f"🚨 {priority}: {count} ({percentage:.0f}%)")
-            elif priority.lower() == 'high':
-                st.warning(f"⚡ {priority}: {count} ({percentage:.0f}%)")
-            else:
-                st.info(f"📋 {priority}: {count} ({percentage:.0f}%)")
+    st.markdown(_breakdown_markdown(
+        priority_counts, total_missions, {'urgent': '🚨', 'high': '⚡'}, '📋', decimals=0
+    ))
 
 st.divider()
 
@@ -274,43 +304,30 @@ st.divider()
 st.markdown("### 🔗 Assignment Overview")
 
 # Build assignment summary
-assignments = []
-for _, mission in missions_df.iterrows():
-    mission_id = mission.get('project_id', 'N/A')
-    
-    # Find assigned pilot
-    assigned_pilots = pilots_df[pilots_df.get('current_assignment', '') == mission_id]
-    pilot_name = assigned_pilots.iloc[0]['name'] if not assigned_pilots.empty else '❌ Unassigned'
-    
-    # Find assigned drone
-    assigned_drones = drones_df[drones_df.get('current_assignment', '') == mission_id]
-    drone_id = assigned_drones.iloc[0]['drone_id'] if not assigned_drones.empty else '❌ Unassigned'
-    
-    assignments.append({
-        'Mission': mission_id,
-        'Client': mission.get('client', 'N/A'),
-        'Location': mission.get('location', 'N/A'),
-        'Pilot': pilot_name,
-        'Drone': drone_id,
-        'Priority': mission.get('priority', 'N/A')
-    })
-
-assignments_df = pd.DataFrame(assignments)
+assignments_df = pd.DataFrame({
+    'Mission': mission_ids,
+    'Client': missions_df.get('client', 'N/A'),
+    'Location': missions_df.get('location', 'N/A'),
+    'Pilot': mission_pilots.fillna('❌ Unassigned'),
+    'Drone': mission_drones.fillna('❌ Unassigned'),
+    'Priority': missions_df.get('priority', 'N/A')
+}, index=missions_df.index)
 
 # Assignment statistics
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    fully_assigned = len([a for a in assignments if '❌' not in a['Pilot'] and '❌' not in a['Drone']])
+    # Same count and rate as the Assignment Rate KPI above
+    fully_assigned = assigned_missions
     st.metric("✅ Fully Assigned", f"{fully_assigned}/{total_missions}", 
-              delta=f"{(fully_assigned/total_missions*100):.0f}%" if total_missions > 0 else "0%")
+              delta=f"{assignment_rate:.0f}%" if total_missions > 0 else "0%")
 
 with col2:
-    partial = len([a for a in assignments if ('❌' in a['Pilot']) != ('❌' in a['Drone'])])
+    partial = int((has_pilot != has_drone).sum())
     st.metric("⚠️ Partially Assigned", partial)
 
 with col3:
-    unassigned = len([a for a in assignments if '❌' in a['Pilot'] and '❌' in a['Drone']])
+    unassigned = int((~has_pilot & ~has_drone).sum())
     st.metric("❌ Unassigned", unassigned)
 
 # Show assignment table
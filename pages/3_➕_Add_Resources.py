@@ -5,15 +5,11 @@ Add Resources page - Add new pilots, drones, or missions
 """
 
 import streamlit as st
-import pandas as pd
 from tools.pilots import add_new_pilot
 from tools.drones import add_new_drone
 from tools.missions import add_new_mission
-from tools.sheets import get_sheet_as_df
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from tools.sheets_cache import clear_sheets, load_sheet_tables, load_sheets
+from config import DRONE_RANGE, MISSION_RANGE, PILOT_RANGE, SPREADSHEET_ID
 
 st.set_page_config(
     page_title="Add Resources - SkyOps Agent",
@@ -27,6 +23,23 @@ st.markdown('<div style="text-align: center; color: #666; margin-bottom: 2rem;">
 
 st.divider()
 
+
+def existing_records():
+    """
+    Pilot, drone and mission sheets as (pilots_df, drones_df, missions_df).
+    
+    One cached batchGet (shared with the Analytics page) serves all three
+    "View Existing" lists. The add forms leave ID generation to the tools,
+    which read the target sheet's ID column live.
+    """
+    return load_sheets(SPREADSHEET_ID, PILOT_RANGE, DRONE_RANGE, MISSION_RANGE)
+
+
+def existing_tables():
+    """The same sheets as Arrow tables, converted once per load for display."""
+    return load_sheet_tables(SPREADSHEET_ID, PILOT_RANGE, DRONE_RANGE, MISSION_RANGE)
+
+
 # Tabs for different resource types
 tab1, tab2, tab3 = st.tabs(["👨‍✈️ Add Pilot", "🚁 Add Drone", "📦 Add Mission"])
 
@@ -72,6 +85,8 @@ with tab1:
                         result = add_new_pilot(pilot_data)
                         
                         if result.get('success'):
+                            # The sheet changed: drop the cached reads
+                            clear_sheets()
                             st.success(f"✅ Pilot added successfully with ID: {result.get('pilot_id')}")
                             st.balloons()
                         else:
@@ -82,11 +97,9 @@ with tab1:
     # Show existing pilots
     with st.expander("📋 View Existing Pilots"):
         try:
-            spreadsheet_id = os.getenv('SPREADSHEET_ID')
-            pilot_range = os.getenv('PILOT_RANGE')
-            pilots_df = get_sheet_as_df(spreadsheet_id, pilot_range)
-            st.dataframe(pilots_df, use_container_width=True, height=300)
-            st.info(f"Total Pilots: {len(pilots_df)}")
+            pilots_table = existing_tables()[0]
+            st.dataframe(pilots_table, use_container_width=True, height=300)
+            st.info(f"Total Pilots: {pilots_table.num_rows}")
         except Exception as e:
             st.error(f"Unable to load existing pilots: {str(e)}")
 
@@ -130,6 +143,8 @@ with tab2:
                         result = add_new_drone(drone_data)
                         
                         if result.get('success'):
+                            # The sheet changed: drop the cached reads
+                            clear_sheets()
                             st.success(f"✅ Drone added successfully with ID: {result.get('drone_id')}")
                             st.balloons()
                         else:
@@ -140,11 +155,9 @@ with tab2:
     # Show existing drones
     with st.expander("🚁 View Existing Drones"):
         try:
-            spreadsheet_id = os.getenv('SPREADSHEET_ID')
-            drone_range = os.getenv('DRONE_RANGE')
-            drones_df = get_sheet_as_df(spreadsheet_id, drone_range)
-            st.dataframe(drones_df, use_container_width=True, height=300)
-            st.info(f"Total Drones: {len(drones_df)}")
+            drones_table = existing_tables()[1]
+            st.dataframe(drones_table, use_container_width=True, height=300)
+            st.info(f"Total Drones: {drones_table.num_rows}")
         except Exception as e:
             st.error(f"Unable to load existing drones: {str(e)}")
 
@@ -189,6 +202,8 @@ with tab3:
                         result = add_new_mission(mission_data)
                         
                         if result.get('success'):
+                            # The sheet changed: drop the cached reads
+                            clear_sheets()
                             st.success(f"✅ Mission added successfully with ID: {result.get('project_id')}")
                             st.balloons()
                         else:
@@ -199,11 +214,9 @@ with tab3:
     # Show existing missions
     with st.expander("📦 View Existing Missions"):
         try:
-            spreadsheet_id = os.getenv('SPREADSHEET_ID')
-            mission_range = os.getenv('MISSION_RANGE')
-            missions_df = get_sheet_as_df(spreadsheet_id, mission_range)
-            st.dataframe(missions_df, use_container_width=True, height=300)
-            st.info(f"Total Missions: {len(missions_df)}")
+            missions_table = existing_tables()[2]
+            st.dataframe(missions_table, use_container_width=True, height=300)
+            st.info(f"Total Missions: {missions_table.num_rows}")
         except Exception as e:
             st.error(f"Unable to load existing missions: {str(e)}")
 
@@ -1,45 +1,54 @@
 # Test Google Sheets connection
 
+import time
+
 from tools.sheets import get_sheet_as_df
-from dotenv import load_dotenv
-import os
+from config import SPREADSHEET_ID
 
-# Load environment variables
-load_dotenv()
+spreadsheet_id = SPREADSHEET_ID
 
-spreadsheet_id = os.getenv('SPREADSHEET_ID')
+# (icon, range, label) of each sheet to read
+SHEETS_TO_CHECK = [
+    ("📋", 'pilot_roster!A:Z', 'pilots'),
+    ("🚁", 'drone_fleet!A:Z', 'drones'),
+    ("📦", 'missions!A:Z', 'missions'),
+]
 
-# Test reading each sheet
-print("Testing Google Sheets connection...\n")
 
-try:
-    print("📋 Reading pilot_roster...")
-    pilots_df = get_sheet_as_df(spreadsheet_id, 'pilot_roster!A:Z')
-    print(f"✅ Found {len(pilots_df)} pilots")
-    print(pilots_df.head())
-    print()
+def check_connection():
+    """
+    Read each sheet once and print its size, a preview and the fetch time.
     
-    print("🚁 Reading drone_fleet...")
-    drones_df = get_sheet_as_df(spreadsheet_id, 'drone_fleet!A:Z')
-    print(f"✅ Found {len(drones_df)} drones")
-    print(drones_df.head())
-    print()
+    Repeated calls in one process (e.g. from IPython) are served by the
+    tools.sheets read cache for SHEET_CACHE_TTL seconds, so the timings
+    show whether a read went to the API.
+    """
+    # Test reading each sheet
+    print("Testing Google Sheets connection...\n")
     
-    print("📦 Reading missions...")
-    missions_df = get_sheet_as_df(spreadsheet_id, 'missions!A:Z')
-    print(f"✅ Found {len(missions_df)} missions")
-    print(missions_df.head())
-    print()
+    try:
+        for icon, range_name, label in SHEETS_TO_CHECK:
+            print(f"{icon} Reading {range_name.split('!')[0]}...")
+            started = time.perf_counter()
+            df = get_sheet_as_df(spreadsheet_id, range_name)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            print(f"✅ Found {len(df)} {label} ({elapsed_ms:.0f} ms)")
+            print(df.head())
+            print()
     
-    print("🎉 All sheets connected successfully!")
+        print("🎉 All sheets connected successfully!")
     
-except FileNotFoundError as e:
-    print(f"❌ Error: {e}")
-    print("Make sure credentials.json is in the project root folder")
+    except FileNotFoundError as e:
+        print(f"❌ Error: {e}")
+        print("Make sure credentials.json is in the project root folder")
     
-except Exception as e:
-    print(f"❌ Error: {e}")
-    print("\nTroubleshooting:")
-    print("1. Check that SPREADSHEET_ID in .env is correct")
-    print("2. Verify the service account email has access to the sheet")
-    print("3. Ensure sheet tab names match: pilot_roster, drone_fleet, missions")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        print("\nTroubleshooting:")
+        print("1. Check that SPREADSHEET_ID in .env is correct")
+        print("2. Verify the service account email has access to the sheet")
+        print("3. Ensure sheet tab names match: pilot_roster, drone_fleet, missions")
+
+
+if __name__ == '__main__':
+    check_connection()
@@ -4,13 +4,9 @@
 Helper functions for drone management.
 """
 
-import pandas as pd
 from typing import Dict
-from tools.sheets import get_sheet_as_df, append_to_sheet
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from tools.sheets import allocate_id_and_append
+from config import DRONES_SHEET_RANGE, SPREADSHEET_ID
 
 
 def add_new_drone(drone_data: Dict) -> Dict:
@@ -29,24 +25,12 @@ def add_new_drone(drone_data: Dict) -> Dict:
     Returns:
         Dictionary with success status and drone_id
     """
-    spreadsheet_id = os.getenv('SPREADSHEET_ID')
-    drones_range = os.getenv('DRONES_SHEET_RANGE')
-    
-    # Load existing drones to generate new ID
-    drones_df = get_sheet_as_df(spreadsheet_id, drones_range)
-    
-    # Generate new drone ID
-    if not drones_df.empty:
-        # Extract numbers from existing IDs (D001 -> 1)
-        existing_ids = drones_df['drone_id'].tolist()
-        max_num = max([int(did.replace('D', '')) for did in existing_ids if did.startswith('D')])
-        new_id = f"D{str(max_num + 1).zfill(3)}"
-    else:
-        new_id = "D001"
+    spreadsheet_id = SPREADSHEET_ID
+    drones_range = DRONES_SHEET_RANGE
     
     # Create new drone record
     new_drone = {
-        'drone_id': new_id,
+        'drone_id': None,  # assigned once the record is valid
         'model': drone_data.get('model'),
         'capabilities': drone_data.get('capabilities'),
         'status': drone_data.get('status', 'Available'),
@@ -66,9 +50,10 @@ def add_new_drone(drone_data: Dict) -> Dict:
             'drone_id': None
         }
     
-    # Append to sheet
-    new_df = pd.DataFrame([new_drone])
-    append_to_sheet(spreadsheet_id, drones_range, new_df)
+    # Append the record; the new ID follows from the row the server gives it
+    new_id = allocate_id_and_append(
+        spreadsheet_id, drones_range, 'D', 'drone_id', new_drone
+    )
     
     return {
         'success': True,
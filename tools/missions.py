@@ -4,13 +4,9 @@
 Helper functions for mission management.
 """
 
-import pandas as pd
 from typing import Dict
-from tools.sheets import get_sheet_as_df, append_to_sheet
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from tools.sheets import allocate_id_and_append
+from config import MISSIONS_SHEET_RANGE, SPREADSHEET_ID
 
 
 def add_new_mission(mission_data: Dict) -> Dict:
@@ -30,24 +26,12 @@ def add_new_mission(mission_data: Dict) -> Dict:
     Returns:
         Dictionary with success status and project_id
     """
-    spreadsheet_id = os.getenv('SPREADSHEET_ID')
-    missions_range = os.getenv('MISSIONS_SHEET_RANGE')
-    
-    # Load existing missions to generate new ID
-    missions_df = get_sheet_as_df(spreadsheet_id, missions_range)
-    
-    # Generate new project ID
-    if not missions_df.empty:
-        # Extract numbers from existing IDs (PRJ001 -> 1)
-        existing_ids = missions_df['project_id'].tolist()
-        max_num = max([int(pid.replace('PRJ', '')) for pid in existing_ids if pid.startswith('PRJ')])
-        new_id = f"PRJ{str(max_num + 1).zfill(3)}"
-    else:
-        new_id = "PRJ001"
+    spreadsheet_id = SPREADSHEET_ID
+    missions_range = MISSIONS_SHEET_RANGE
     
     # Create new mission record
     new_mission = {
-        'project_id': new_id,
+        'project_id': None,  # assigned once the record is valid
         'client': mission_data.get('client'),
         'location': mission_data.get('location'),
         'required_skills': mission_data.get('required_skills'),
@@ -68,9 +52,10 @@ def add_new_mission(mission_data: Dict) -> Dict:
             'project_id': None
         }
     
-    # Append to sheet
-    new_df = pd.DataFrame([new_mission])
-    append_to_sheet(spreadsheet_id, missions_range, new_df)
+    # Append the record; the new ID follows from the row the server gives it
+    new_id = allocate_id_and_append(
+        spreadsheet_id, missions_range, 'PRJ', 'project_id', new_mission
+    )
     
     return {
         'success': True,
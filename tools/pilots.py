@@ -4,13 +4,9 @@
 Helper functions for pilot management.
 """
 
-import pandas as pd
 from typing import Dict
-from tools.sheets import get_sheet_as_df, append_to_sheet
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from tools.sheets import allocate_id_and_append
+from config import PILOTS_SHEET_RANGE, SPREADSHEET_ID
 
 
 def add_new_pilot(pilot_data: Dict) -> Dict:
@@ -30,24 +26,12 @@ def add_new_pilot(pilot_data: Dict) -> Dict:
     Returns:
         Dictionary with success status and pilot_id
     """
-    spreadsheet_id = os.getenv('SPREADSHEET_ID')
-    pilots_range = os.getenv('PILOTS_SHEET_RANGE')
-    
-    # Load existing pilots to generate new ID
-    pilots_df = get_sheet_as_df(spreadsheet_id, pilots_range)
-    
-    # Generate new pilot ID
-    if not pilots_df.empty:
-        # Extract numbers from existing IDs (P001 -> 1)
-        existing_ids = pilots_df['pilot_id'].tolist()
-        max_num = max([int(pid.replace('P', '')) for pid in existing_ids if pid.startswith('P')])
-        new_id = f"P{str(max_num + 1).zfill(3)}"
-    else:
-        new_id = "P001"
+    spreadsheet_id = SPREADSHEET_ID
+    pilots_range = PILOTS_SHEET_RANGE
     
     # Create new pilot record
     new_pilot = {
-        'pilot_id': new_id,
+        'pilot_id': None,  # assigned once the record is valid
         'name': pilot_data.get('name'),
         'skills': pilot_data.get('skills'),
         'certifications': pilot_data.get('certifications'),
@@ -68,9 +52,10 @@ def add_new_pilot(pilot_data: Dict) -> Dict:
             'pilot_id': None
         }
     
-    # Append to sheet
-    new_df = pd.DataFrame([new_pilot])
-    append_to_sheet(spreadsheet_id, pilots_range, new_df)
+    # Append the record; the new ID follows from the row the server gives it
+    new_id = allocate_id_and_append(
+        spreadsheet_id, pilots_range, 'P', 'pilot_id', new_pilot
+    )
     
     return {
         'success': True,
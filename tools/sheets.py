@@ -8,42 +8,132 @@ Responsibilities:
 - Authenticate using a service account
 - Read a sheet into a pandas DataFrame
 - Write updates back to a sheet
+- Cache recent reads for a short TTL (invalidated by writes)
 
 Do NOT include any business logic here.
 """
 
 import os
+import re
+import threading
+import time
+from functools import lru_cache
+from google.auth.exceptions import GoogleAuthError
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from httplib2 import HttpLib2Error
 import pandas as pd
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 
 # Define the scopes
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# Optional disk cache that survives restarts (needs the diskcache package):
+# snapshots are stored with the spreadsheet's Drive modifiedTime and reused
+# while it is unchanged, so a fresh process skips downloading unchanged
+# sheets. Unset (the default) disables it. Reading modifiedTime needs the
+# Drive metadata scope (and the Drive API enabled for the service account).
+SHEETS_DISK_CACHE_DIR = os.getenv('SHEETS_DISK_CACHE_DIR', '')
+if SHEETS_DISK_CACHE_DIR:
+    SCOPES = SCOPES + ['https://www.googleapis.com/auth/drive.metadata.readonly']
+
+# Retries for requests that are safe to repeat (reads and value writes):
+# googleapiclient retries 429 and 5xx responses with exponential backoff and
+# jitter. Appends are not retried, since a retried append that had already
+# landed would insert the row twice.
+SHEETS_NUM_RETRIES = int(os.getenv('SHEETS_NUM_RETRIES', '3'))
+
+# Recoverable failures raised by the helpers below: API errors, auth
+# failures, missing credentials file and network errors (OSError, plus
+# httplib2's own errors such as ServerNotFoundError, which are not OSErrors)
+SHEETS_ERRORS = (HttpError, GoogleAuthError, OSError, HttpLib2Error)
+
+# Read cache: (spreadsheet_id, range) -> (loaded_at, DataFrame). Reads within
+# SHEET_CACHE_TTL seconds are served from memory; writes through this module
+# invalidate (or refresh) the affected sheet tab.
+SHEET_CACHE_TTL = float(os.getenv('SHEET_CACHE_TTL', '60'))
+_sheet_cache: Dict[Tuple[str, str], Tuple[float, pd.DataFrame]] = {}
+
+# Authenticated services, one per thread: building a service re-reads the
+# key file and opens a new HTTP connection, and the httplib2 transport
+# underneath it is not thread-safe to share.
+_thread_local = threading.local()
+
+# Service-account credentials, shared by every thread's service: the access
+# token they hold stays valid for an hour, so a new thread (e.g. a new
+# Streamlit session) reuses it instead of signing and exchanging a fresh JWT.
+_credentials: Dict[str, Credentials] = {}
+_credentials_lock = threading.Lock()
+
 
 def get_sheets_service():
     """
     Authenticate and return a Google Sheets API service instance.
     
+    The service is built once per thread (and credentials file) and then
+    reused, so its HTTP connection is kept alive across calls; the
+    credentials (and their access token) are shared across threads.
+    
     Returns:
         Resource: Google Sheets API service object
     """
     creds_file = os.getenv('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
     
-    if not os.path.exists(creds_file):
-        raise FileNotFoundError(f"Credentials file not found: {creds_file}")
+    cached = getattr(_thread_local, 'service', None)
+    if cached is not None and cached[0] == creds_file:
+        return cached[1]
     
-    credentials = Credentials.from_service_account_file(
-        creds_file, 
-        scopes=SCOPES
+    # The Sheets v4 discovery document ships with the client library:
+    # static_discovery=True loads it from there (no HTTP fetch on a cold
+    # start) and cache_discovery=False skips the file-cache lookup (and its
+    # warning)
+    service = build(
+        'sheets', 'v4',
+        credentials=_service_credentials(creds_file),
+        static_discovery=True,
+        cache_discovery=False
     )
-    
-    service = build('sheets', 'v4', credentials=credentials)
+    _thread_local.service = (creds_file, service)
     return service
 
 
+def _values_api():
+    """
+    The spreadsheets().values() resource of this thread's service.
+    
+    Every spreadsheets() call rebuilds its resource from the discovery
+    document (about 20 ms of CPU), so the built resource is kept with the
+    service and reused by all the helpers below.
+    """
+    service = get_sheets_service()
+    
+    cached = getattr(_thread_local, 'values_api', None)
+    if cached is not None and cached[0] is service:
+        return cached[1]
+    
+    values_api = service.spreadsheets().values()
+    _thread_local.values_api = (service, values_api)
+    return values_api
+
+
+def _service_credentials(creds_file: str) -> Credentials:
+    """Service-account credentials for a key file, loaded once and shared."""
+    with _credentials_lock:
+        credentials = _credentials.get(creds_file)
+        if credentials is None:
+            if not os.path.exists(creds_file):
+                raise FileNotFoundError(f"Credentials file not found: {creds_file}")
+            
+            credentials = Credentials.from_service_account_file(
+                creds_file, 
+                scopes=SCOPES
+            )
+            _credentials[creds_file] = credentials
+    return credentials
+
+
 def get_sheet_as_df(spreadsheet_id: str, range_name: str) -> pd.DataFrame:
     """
     Read a Google Sheet and return it as a pandas DataFrame.
@@ -53,18 +143,302 @@ def get_sheet_as_df(spreadsheet_id: str, range_name: str) -> pd.DataFrame:
         range_name: The A1 notation of the range to retrieve (e.g., 'Sheet1!A1:Z')
     
     Returns:
-        pd.DataFrame: The sheet data as a DataFrame
+        pd.DataFrame: The sheet data as a DataFrame (served from the read
+        cache when fresh; always a copy the caller may modify)
     """
-    service = get_sheets_service()
-    sheet = service.spreadsheets()
+    cached = _cache_get(spreadsheet_id, range_name)
+    if cached is not None:
+        return cached
+    
+    modified = _disk_validator(spreadsheet_id)
+    df = _disk_get(spreadsheet_id, range_name, modified)
+    if df is None:
+        values_api = _values_api()
+        
+        result = values_api.get(
+            spreadsheetId=spreadsheet_id,
+            range=range_name,
+            fields='values'
+        ).execute(num_retries=SHEETS_NUM_RETRIES)
+        
+        df = _values_to_df(result.get('values', []))
+        _disk_put(spreadsheet_id, range_name, modified, df)
+    
+    _cache_put(spreadsheet_id, range_name, df)
+    return df.copy()
+
+
+def batch_get_sheets_as_df(spreadsheet_id: str, ranges: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Read several ranges of a Google Sheet in one API call.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        ranges: A1 notation ranges to retrieve (e.g., ['Sheet1!A:H', 'Sheet2!A:G'])
+    
+    Returns:
+        Dict[str, pd.DataFrame]: DataFrame per requested range, keyed by the
+        range string as passed in (the API may echo a normalised form)
+    """
+    frames = {}
+    missing = []
+    for range_name in ranges:
+        cached = _cache_get(spreadsheet_id, range_name)
+        if cached is not None:
+            frames[range_name] = cached
+        else:
+            missing.append(range_name)
+    
+    if not missing:
+        return frames
     
-    result = sheet.values().get(
+    # Unchanged sheets from the disk cache, if enabled
+    modified = _disk_validator(spreadsheet_id)
+    for range_name in list(missing):
+        df = _disk_get(spreadsheet_id, range_name, modified)
+        if df is not None:
+            _cache_put(spreadsheet_id, range_name, df)
+            frames[range_name] = df.copy()
+            missing.remove(range_name)
+    
+    if not missing:
+        return frames
+    
+    values_api = _values_api()
+    
+    result = values_api.batchGet(
         spreadsheetId=spreadsheet_id,
-        range=range_name
-    ).execute()
+        ranges=missing,
+        fields='valueRanges(values)'
+    ).execute(num_retries=SHEETS_NUM_RETRIES)
+    
+    # valueRanges come back in request order
+    value_ranges = result.get('valueRanges', [])
+    for range_name, value_range in zip(missing, value_ranges):
+        df = _values_to_df(value_range.get('values', []))
+        _cache_put(spreadsheet_id, range_name, df)
+        _disk_put(spreadsheet_id, range_name, modified, df)
+        frames[range_name] = df.copy()
+    
+    return frames
+
+
+def batch_get_sheet_data(spreadsheet_id: str, ranges: List[str]) -> List[List[List[str]]]:
+    """
+    Read several ranges as raw row lists in one API call.
+    
+    For light consumers (landing-page counters) that do not need DataFrames;
+    results are not cached here.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        ranges: A1 notation ranges to retrieve
+    
+    Returns:
+        List[List[List[str]]]: Rows per requested range, in request order
+    """
+    values_api = _values_api()
+    
+    result = values_api.batchGet(
+        spreadsheetId=spreadsheet_id,
+        ranges=ranges,
+        fields='valueRanges(values)'
+    ).execute(num_retries=SHEETS_NUM_RETRIES)
+    
+    value_ranges = result.get('valueRanges', [])
+    return [value_range.get('values', []) for value_range in value_ranges]
+
+
+def batch_get_columns(spreadsheet_id: str, ranges: List[str]) -> Dict[str, List[List[str]]]:
+    """
+    Read narrow ranges column-major in one API call, without building DataFrames.
+    
+    Meant for cheap aggregates (row counts, status tallies) over one or two
+    columns; results are not cached.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        ranges: A1 notation column ranges (e.g., ['Sheet1!F:F'])
+    
+    Returns:
+        Dict[str, List[List[str]]]: Columns per requested range (header cell
+        first; trailing empty cells are omitted by the API)
+    """
+    values_api = _values_api()
+    
+    result = values_api.batchGet(
+        spreadsheetId=spreadsheet_id,
+        ranges=ranges,
+        majorDimension='COLUMNS',
+        fields='valueRanges(values)'
+    ).execute(num_retries=SHEETS_NUM_RETRIES)
     
-    values = result.get('values', [])
+    value_ranges = result.get('valueRanges', [])
+    return {
+        range_name: value_range.get('values', [])
+        for range_name, value_range in zip(ranges, value_ranges)
+    }
+
+
+def get_column_values(spreadsheet_id: str, range_name: str, column: int = 0) -> List[str]:
+    """
+    Read the data cells of one column of a table, without the other columns.
+    
+    For lookups that need a single field of every row (e.g. the ID column
+    when generating the next ID); the whole-sheet read is not needed.
+    Results are not cached.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        range_name: Table range with the header in its first row (e.g., 'Sheet1!A:Z')
+        column: 0-based column position from the range's first column
+    
+    Returns:
+        List[str]: Cell values below the header (trailing empty cells omitted)
+    """
+    column_range = a1_column(range_name, column)
+    values = batch_get_columns(spreadsheet_id, [column_range])[column_range]
+    return values[0][1:] if values else []
+
+
+def get_cached_version(spreadsheet_id: str, range_name: str) -> Optional[float]:
+    """
+    Return the load time of the cached snapshot for a range, if still fresh.
+    
+    Callers that derive data from a sheet (indexes, typed frames) can key
+    their own caches on this value to know when the snapshot changed.
+    
+    Returns:
+        Monotonic timestamp of the cached snapshot, or None if not cached
+    """
+    entry = _sheet_cache.get((spreadsheet_id, range_name))
+    if entry is None or time.monotonic() - entry[0] >= SHEET_CACHE_TTL:
+        return None
+    return entry[0]
+
+
+def invalidate_sheet_cache(spreadsheet_id: str, range_name: Optional[str] = None) -> None:
+    """
+    Drop cached reads for a sheet tab, or for the whole spreadsheet.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        range_name: Any A1 range on the tab to invalidate; every cached range
+            on that tab is dropped. None drops the whole spreadsheet.
+    """
+    tab = _sheet_tab(range_name) if range_name else None
+    for key in list(_sheet_cache):
+        if key[0] == spreadsheet_id and (tab is None or _sheet_tab(key[1]) == tab):
+            _sheet_cache.pop(key, None)
+    
+    # Drive's modifiedTime can lag a write, so drop disk snapshots explicitly
+    disk = _disk_cache()
+    if disk is not None:
+        for key in list(disk):
+            if key[0] == spreadsheet_id and (tab is None or _sheet_tab(key[1]) == tab):
+                disk.delete(key)
+
+
+def _sheet_tab(range_name: str) -> str:
+    """Tab name of an A1 range ('Pilot Roster!A2:H' -> 'Pilot Roster')."""
+    return range_name.split('!', 1)[0].strip("'")
+
+
+def _cache_get(spreadsheet_id: str, range_name: str) -> Optional[pd.DataFrame]:
+    """Copy of the cached frame for a range, or None if missing/expired."""
+    entry = _sheet_cache.get((spreadsheet_id, range_name))
+    if entry is None or time.monotonic() - entry[0] >= SHEET_CACHE_TTL:
+        return None
+    return entry[1].copy()
+
+
+def _cache_put(spreadsheet_id: str, range_name: str, df: pd.DataFrame) -> None:
+    """Store a snapshot for a range (the caller must not keep mutating df)."""
+    _sheet_cache[(spreadsheet_id, range_name)] = (time.monotonic(), df)
+
+
+@lru_cache(maxsize=1)
+def _disk_cache():
+    """The diskcache.Cache in SHEETS_DISK_CACHE_DIR; None if disabled or not installed."""
+    if not SHEETS_DISK_CACHE_DIR:
+        return None
+    try:
+        import diskcache
+    except ImportError:
+        return None
+    return diskcache.Cache(SHEETS_DISK_CACHE_DIR)
+
+
+def _disk_validator(spreadsheet_id: str) -> Optional[str]:
+    """
+    Drive modifiedTime of the spreadsheet, used to validate disk snapshots.
+    
+    One small metadata request per memory-cache miss; None when the disk
+    cache is off or the metadata cannot be read (reads then skip the disk).
+    """
+    if _disk_cache() is None:
+        return None
     
+    creds_file = os.getenv('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
+    cached = getattr(_thread_local, 'drive', None)
+    if cached is not None and cached[0] == creds_file:
+        files_api = cached[1]
+    else:
+        # Keep the files() resource rather than the service (see _values_api)
+        files_api = build(
+            'drive', 'v3',
+            credentials=_service_credentials(creds_file),
+            static_discovery=True,
+            cache_discovery=False
+        ).files()
+        _thread_local.drive = (creds_file, files_api)
+    
+    try:
+        result = files_api.get(
+            fileId=spreadsheet_id,
+            fields='modifiedTime',
+            supportsAllDrives=True
+        ).execute(num_retries=SHEETS_NUM_RETRIES)
+    except SHEETS_ERRORS:
+        return None
+    return result.get('modifiedTime')
+
+
+def _disk_get(spreadsheet_id: str, range_name: str, modified: Optional[str]) -> Optional[pd.DataFrame]:
+    """Disk snapshot of a range if it was stored at this modifiedTime."""
+    disk = _disk_cache()
+    if disk is None or modified is None:
+        return None
+    entry = disk.get((spreadsheet_id, range_name))
+    if entry is None or entry[0] != modified:
+        return None
+    return entry[1]
+
+
+def _disk_put(spreadsheet_id: str, range_name: str, modified: Optional[str], df: pd.DataFrame) -> None:
+    """Store a snapshot on disk, tagged with the modifiedTime read before fetching it."""
+    disk = _disk_cache()
+    if disk is not None and modified is not None:
+        disk.set((spreadsheet_id, range_name), (modified, df))
+
+
+def _df_to_values(df: pd.DataFrame, include_header: bool = True) -> List[List]:
+    """
+    Convert a DataFrame into a Sheets API values grid.
+    
+    The frame is converted to one object array (not copied when all its
+    columns are already object dtype) and listed once.
+    """
+    rows = df.to_numpy(dtype=object, copy=False).tolist()
+    if include_header:
+        return [df.columns.tolist(), *rows]
+    return rows
+
+
+def _values_to_df(values: List[List]) -> pd.DataFrame:
+    """
+    Convert a Sheets API values grid (header row first) into a DataFrame.
+    """
     if not values:
         return pd.DataFrame()
     
@@ -80,7 +454,8 @@ def update_sheet_from_df(
     spreadsheet_id: str, 
     range_name: str, 
     df: pd.DataFrame,
-    include_header: bool = True
+    include_header: bool = True,
+    value_input_option: str = 'RAW'
 ) -> dict:
     """
     Write a pandas DataFrame back to a Google Sheet.
@@ -90,37 +465,263 @@ def update_sheet_from_df(
         range_name: The A1 notation of the range to update (e.g., 'Sheet1!A1')
         df: The DataFrame to write
         include_header: Whether to include column headers in the update
+        value_input_option: 'RAW' (default) stores values as given;
+            'USER_ENTERED' has the server parse formulas, numbers and dates
     
     Returns:
-        dict: The API response containing update details
+        dict: The API response, trimmed to the update summary
     """
-    service = get_sheets_service()
-    sheet = service.spreadsheets()
-    
-    # Convert DataFrame to list of lists
-    if include_header:
-        values = [df.columns.tolist()] + df.values.tolist()
-    else:
-        values = df.values.tolist()
+    values_api = _values_api()
     
     body = {
-        'values': values
+        'values': _df_to_values(df, include_header)
     }
     
-    result = sheet.values().update(
+    result = values_api.update(
         spreadsheetId=spreadsheet_id,
         range=range_name,
-        valueInputOption='RAW',
-        body=body
-    ).execute()
+        valueInputOption=value_input_option,
+        body=body,
+        fields='updatedRange,updatedRows'
+    ).execute(num_retries=SHEETS_NUM_RETRIES)
+    
+    # Parsed (USER_ENTERED) cells may read back differently from df
+    _refresh_after_write(spreadsheet_id, range_name, df, include_header and value_input_option == 'RAW')
+    return result
+
+
+def batch_update_sheets_from_dfs(
+    spreadsheet_id: str,
+    updates: List[Tuple[str, pd.DataFrame]],
+    include_header: bool = True
+) -> dict:
+    """
+    Write several DataFrames back to a Google Sheet in one API call.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        updates: List of (range_name, df) pairs to write
+        include_header: Whether to include column headers in each update
+    
+    Returns:
+        dict: The API response, trimmed to the update summary
+    """
+    values_api = _values_api()
+    
+    data = [
+        {'range': range_name, 'values': _df_to_values(df, include_header)}
+        for range_name, df in updates
+    ]
+    
+    body = {
+        'valueInputOption': 'RAW',
+        'data': data
+    }
+    
+    result = values_api.batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body=body,
+        fields='totalUpdatedRows,totalUpdatedCells'
+    ).execute(num_retries=SHEETS_NUM_RETRIES)
+    
+    for range_name, df in updates:
+        _refresh_after_write(spreadsheet_id, range_name, df, include_header)
+    return result
+
+
+def batch_update_df_cells(
+    spreadsheet_id: str,
+    updates: List[Tuple[str, pd.DataFrame, List[Tuple[int, str]]]]
+) -> dict:
+    """
+    Write only the changed cells of several DataFrames in one API call.
+    
+    Each DataFrame must be the full table read from range_name (header row
+    first) with the listed cells already modified locally. Only those
+    cells are sent; the read cache is refreshed with the whole frame.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        updates: List of (range_name, df, cells) where cells are
+            (row position, column name) pairs within df
+    
+    Returns:
+        dict: The API response, trimmed to the update summary
+    """
+    values_api = _values_api()
+    
+    data = []
+    for range_name, df, cells in updates:
+        for row, column in cells:
+            value = df.iat[row, df.columns.get_loc(column)]
+            data.append({
+                'range': a1_cell(range_name, row, df.columns.get_loc(column)),
+                'values': [[_to_cell(value)]]
+            })
+    
+    body = {
+        'valueInputOption': 'RAW',
+        'data': data
+    }
+    
+    result = values_api.batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body=body,
+        fields='totalUpdatedRows,totalUpdatedCells'
+    ).execute(num_retries=SHEETS_NUM_RETRIES)
     
+    for range_name, df, _ in updates:
+        _refresh_after_write(spreadsheet_id, range_name, df, include_header=True)
     return result
+    
+
+def allocate_id_and_append(
+    spreadsheet_id: str,
+    range_name: str,
+    prefix: str,
+    id_column: str,
+    record: Dict
+) -> str:
+    """
+    Append a validated record and give it the next sequential ID.
+    
+    The row is appended first with an empty ID cell, so the Sheets server
+    decides its position even with concurrent writers in other processes.
+    The ID is then derived from the ID cells above that row and written
+    back: each ID-less row above counts as an insert still in progress and
+    takes the next number, so every writer derives the same ID for a row.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        range_name: Table range of the sheet (e.g., 'pilot_roster!A:H')
+        prefix: ID prefix (e.g., 'P' for P001)
+        id_column: Record key and sheet column holding the ID; it must be
+            the record's first key (the sheet's first column)
+        record: Cell values keyed by column, in sheet column order; the ID
+            is filled in place
+    
+    Returns:
+        str: The new ID
+    """
+    record[id_column] = ''
+    result = append_row(spreadsheet_id, range_name, list(record.values()))
+    
+    # 'pilot_roster!A6:H6' -> data position 4 below a header in row 1
+    updated_range = result['updates']['updatedRange']
+    appended_row = int(re.search(r'!\$?[A-Z]+\$?(\d+)', updated_range).group(1))
+    position = appended_row - _range_origin(range_name)[2] - 1
+    
+    ids_above = get_column_values(spreadsheet_id, range_name)[:position]
+    ids_above += [''] * (position - len(ids_above))
+    
+    number = 0
+    for cell in ids_above:
+        cell = str(cell).strip()
+        if not cell:
+            number += 1
+        elif cell.startswith(prefix) and cell[len(prefix):].isdecimal():
+            number = max(number, int(cell[len(prefix):]))
+    
+    new_id = f"{prefix}{str(number + 1).zfill(3)}"
+    record[id_column] = new_id
+    
+    _values_api().update(
+        spreadsheetId=spreadsheet_id,
+        range=a1_cell(range_name, position, 0),
+        valueInputOption='RAW',
+        body={'values': [[new_id]]},
+        fields='updatedRange'
+    ).execute(num_retries=SHEETS_NUM_RETRIES)
+    invalidate_sheet_cache(spreadsheet_id, range_name)
+    
+    return new_id
+
+
+def a1_cell(range_name: str, row: int, column: int) -> str:
+    """
+    A1 address of a data cell in a table range.
+    
+    Args:
+        range_name: Table range with the header in its first row
+            (e.g., 'Pilot Roster!A2:H' or 'pilot_roster!A:H')
+        row: 0-based row position below the header
+        column: 0-based column position from the range's first column
+    
+    Returns:
+        str: Single-cell A1 range (e.g., 'Pilot Roster!F5')
+    """
+    tab, first_column, header_row = _range_origin(range_name)
+    return f"{tab}!{_column_letter(first_column + column)}{header_row + 1 + row}"
+
+
+def a1_column(range_name: str, column: int) -> str:
+    """
+    A1 range of one whole column of a table range, header cell included.
+    
+    Args:
+        range_name: Table range with the header in its first row
+            (e.g., 'pilot_roster!A:H')
+        column: 0-based column position from the range's first column
+    
+    Returns:
+        str: Open-ended column range (e.g., 'pilot_roster!A1:A')
+    """
+    tab, first_column, header_row = _range_origin(range_name)
+    letter = _column_letter(first_column + column)
+    return f"{tab}!{letter}{header_row}:{letter}"
+
+
+def a1_header_row(range_name: str) -> str:
+    """
+    A1 range of the header row of a table range, from its first column on.
+    
+    Args:
+        range_name: Table range with the header in its first row
+            (e.g., 'pilot_roster!A:H')
+    
+    Returns:
+        str: Open-ended row range (e.g., 'pilot_roster!A1:1')
+    """
+    tab, first_column, header_row = _range_origin(range_name)
+    return f"{tab}!{_column_letter(first_column)}{header_row}:{header_row}"
+
+
+def _range_origin(range_name: str) -> Tuple[str, int, int]:
+    """Tab name, 0-based first column and 1-based header row of a table range."""
+    tab, _, cells = range_name.partition('!')
+    start = cells.split(':', 1)[0]
+    letters = start.rstrip('0123456789') or 'A'
+    header_row = int(start[len(letters):] or 1)
+    
+    first_column = 0
+    for letter in letters.upper():
+        first_column = first_column * 26 + (ord(letter) - ord('A') + 1)
+    
+    return tab, first_column - 1, header_row
+    
+
+def _column_letter(index: int) -> str:
+    """Spreadsheet column letter for a 0-based column index (0 -> 'A', 26 -> 'AA')."""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+    
+
+def _to_cell(value):
+    """JSON-serialisable cell value for a DataFrame scalar (NA -> '')."""
+    if pd.isna(value):
+        return ''
+    return value.item() if hasattr(value, 'item') else value
 
 
 def append_to_sheet(
     spreadsheet_id: str,
     range_name: str,
-    df: pd.DataFrame
+    df: pd.DataFrame,
+    value_input_option: str = 'RAW'
 ) -> dict:
     """
     Append rows from a DataFrame to a Google Sheet.
@@ -129,25 +730,79 @@ def append_to_sheet(
         spreadsheet_id: The ID of the Google Spreadsheet
         range_name: The A1 notation of the range to append to (e.g., 'Sheet1!A:Z')
         df: The DataFrame with rows to append
+        value_input_option: 'RAW' (default) or 'USER_ENTERED'; see
+            update_sheet_from_df
     
     Returns:
-        dict: The API response containing append details
+        dict: The API response, trimmed to the updated range and row count
     """
-    service = get_sheets_service()
-    sheet = service.spreadsheets()
+    return _append_values(
+        spreadsheet_id, range_name, _df_to_values(df, include_header=False), value_input_option
+    )
+
+
+def append_row(
+    spreadsheet_id: str,
+    range_name: str,
+    row: List,
+    value_input_option: str = 'RAW'
+) -> dict:
+    """
+    Append a single row of values to a Google Sheet.
     
-    values = df.values.tolist()
+    Cheaper than append_to_sheet for one record: no DataFrame is built.
+    The server inserts the row after the table, so concurrent appends do
+    not overwrite each other.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        range_name: The A1 notation of the table to append to (e.g., 'Sheet1!A:Z')
+        row: Cell values in sheet column order
+        value_input_option: 'RAW' (default) or 'USER_ENTERED'; see
+            update_sheet_from_df
+    
+    Returns:
+        dict: The API response, trimmed to the updated range and row count
+    """
+    return _append_values(spreadsheet_id, range_name, [row], value_input_option)
+
+
+def _append_values(
+    spreadsheet_id: str,
+    range_name: str,
+    values: List[List],
+    value_input_option: str = 'RAW'
+) -> dict:
+    """
+    Append a values grid below a table and invalidate the tab's cached reads.
+    """
+    values_api = _values_api()
     
     body = {
         'values': values
     }
     
-    result = sheet.values().append(
+    result = values_api.append(
         spreadsheetId=spreadsheet_id,
         range=range_name,
-        valueInputOption='RAW',
+        valueInputOption=value_input_option,
         insertDataOption='INSERT_ROWS',
-        body=body
+        body=body,
+        fields='updates(updatedRange,updatedRows)'
     ).execute()
     
+    invalidate_sheet_cache(spreadsheet_id, range_name)
     return result
+
+
+def _refresh_after_write(spreadsheet_id: str, range_name: str, df: pd.DataFrame, include_header: bool) -> None:
+    """
+    Keep the read cache consistent after writing df to range_name.
+    
+    Other cached ranges on the same tab are dropped. A full-table write
+    (header included) is exactly what a read of the same range returns,
+    so it is cached directly and the next read skips the API.
+    """
+    invalidate_sheet_cache(spreadsheet_id, range_name)
+    if include_header:
+        _cache_put(spreadsheet_id, range_name, df.copy())
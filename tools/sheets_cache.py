@@ -0,0 +1,93 @@
+# Part of SkyOps Agent system – see README for architecture
+
+"""
+Streamlit-cached sheet reads shared by the dashboard pages.
+
+Page scripts re-run on every interaction; loading through here lets the
+Analytics and Add Resources pages share one read of the three sheets
+(one batchGet, reused for up to a minute) instead of each fetching its own.
+Callers that write to a sheet should call clear_sheets() afterwards.
+"""
+
+from typing import Tuple
+import pandas as pd
+import streamlit as st
+
+from tools.sheets import batch_get_sheets_as_df
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_sheets(
+    spreadsheet_id: str,
+    pilot_range: str,
+    drone_range: str,
+    mission_range: str
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Load the pilot, drone and mission sheets in one API call.
+    
+    Pilot and drone status and location, and mission priority, are stored
+    as 'category' (a handful of values each), so the pages' comparisons and
+    value counts work on integer codes.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        pilot_range: A1 range of the pilot roster
+        drone_range: A1 range of the drone fleet
+        mission_range: A1 range of the missions sheet
+    
+    Returns:
+        Tuple of (pilots_df, drones_df, missions_df)
+    """
+    frames = batch_get_sheets_as_df(spreadsheet_id, [pilot_range, drone_range, mission_range])
+    return (
+        _categorize(frames[pilot_range], 'status', 'location'),
+        _categorize(frames[drone_range], 'status', 'location'),
+        _categorize(frames[mission_range], 'priority')
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_sheet_tables(
+    spreadsheet_id: str,
+    pilot_range: str,
+    drone_range: str,
+    mission_range: str
+) -> Tuple:
+    """
+    The load_sheets frames as Arrow tables, for display with st.dataframe.
+    
+    st.dataframe converts a DataFrame to Arrow on every render; the tables
+    are converted once per load instead. Without pyarrow the frames are
+    returned as they are.
+    
+    Args:
+        spreadsheet_id: The ID of the Google Spreadsheet
+        pilot_range: A1 range of the pilot roster
+        drone_range: A1 range of the drone fleet
+        mission_range: A1 range of the missions sheet
+    
+    Returns:
+        Tuple of (pilots, drones, missions) Arrow tables (or DataFrames)
+    """
+    frames = load_sheets(spreadsheet_id, pilot_range, drone_range, mission_range)
+    try:
+        import pyarrow
+    except ImportError:
+        return frames
+    
+    return tuple(pyarrow.Table.from_pandas(df, preserve_index=False) for df in frames)
+
+
+def clear_sheets() -> None:
+    """Drop the cached loads, e.g. after a write to one of the sheets."""
+    load_sheets.clear()
+    load_sheet_tables.clear()
+
+
+def _categorize(df: pd.DataFrame, *columns: str) -> pd.DataFrame:
+    """Store low-cardinality columns as 'category' once per load."""
+    for column in columns:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df